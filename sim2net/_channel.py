@@ -30,6 +30,10 @@ maximum transmission time in the *simulation time* units (see:
 """
 
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+
 from sim2net.utility import logger
 from sim2net.utility.randomness import get_random_generator
 from sim2net.utility.validation import check_argument_type
@@ -49,6 +53,19 @@ class _Output(object):
         presumed that these methods are called at each step of the simulation.
     """
 
+    #: The maximum number of delivered packets that may be kept in front of
+    #: the transmitted ones before they are discarded.
+    __MAXIMUM_DELIVERED_PACKETS = 1024
+
+    __slots__ = ('_Output__logger', '_Output__random_generator',
+                 '_Output__time', '_Output__packet_loss', '_Output__node_id',
+                 '_Output__packet_counter',
+                 '_Output__maximum_transmission_time',
+                 '_Output__next_transmission_time', '_Output__start_times',
+                 '_Output__end_times', '_Output__first_packet_id',
+                 '_Output__payloads', '_Output__receivers', '_Output__head',
+                 '_Output__pending')
+
     def __init__(self, time, packet_loss, node_id, maximum_transmission_time):
         """
         *Parameters*:
@@ -75,36 +92,37 @@ class _Output(object):
         self.__packet_counter = int(-1)
         self.__maximum_transmission_time = maximum_transmission_time
         self.__next_transmission_time = float(-1.0)
-        # [ transmission start time,  transmission end time,
-        #   message identifier,  (sending node identifier, message),
-        #   [ list of neighboring nodes ] ]
-        self.__transmitted_packets = list()
-
-    def __get_transmission_neighbors(self, packet_id, transmission_time,
-                                     neighbors):
+        # Transmitted packets are kept in parallel sequences (one element per
+        # packet, ordered by transmission times):
+        #   transmission start times,  transmission end times,
+        #   (sending node identifier, message),  { set of neighboring nodes }
+        # Packet identifiers are consecutive, so they are not stored but
+        # computed from the identifier of the first packet in the sequences.
+        # Packets before the __head position have already been delivered, and
+        # packets from the __pending position onward wait for the beginning of
+        # their transmissions (their sets of neighboring nodes are `None`).
+        # Both start and end times are ascending, so packets that are being
+        # transmitted or should be delivered are found by bisection.
+        self.__start_times = array('d')
+        self.__end_times = array('d')
+        self.__first_packet_id = 0
+        self.__payloads = list()
+        self.__receivers = list()
+        self.__head = 0
+        self.__pending = 0
+
+    def __discard_delivered_packets(self):
         """
-        Returns a list of neighboring nodes at the beginning of packet
-        transmission.
-
-        *Parameters*:
-            - **packet_id** (`int`): an identifier of the transmitted packet;
-            - **transmission_time** (`float`): scheduled start time of the
-              transmission;
-            - **neighbors** (`list`): a list of identifiers of all neighboring
-              nodes of the sender at the current simulation step.
-
-        *Returns*:
-            (`list`) a list of identifiers of neighboring nodes of the sender
-            for the given packet transmission or `None` value if the
-            transmission time has not yet begun.
+        Removes already delivered packets, i.e. these placed before the
+        current head position, from the sequences of transmitted packets.
         """
-        if transmission_time \
-                <= self.__time.simulation_time + self.__time.simulation_period:
-            if self.__logger.isEnabledFor('DEBUG'):
-                self.__logger.debug('Node #%d: transmitting packet %d'
-                                    % (self.__node_id, packet_id))
-            return neighbors
-        return None
+        del self.__start_times[:self.__head]
+        del self.__end_times[:self.__head]
+        del self.__payloads[:self.__head]
+        del self.__receivers[:self.__head]
+        self.__first_packet_id += self.__head
+        self.__pending -= self.__head
+        self.__head = 0
 
     def send_message(self, message, neighbors):
         """
@@ -123,57 +141,127 @@ class _Output(object):
                                 ' passed to send!' % self.__node_id)
             return
         self.__packet_counter += 1
-        while True:
-            message_transmission_time = \
-                self.__random_generator.uniform(
-                    0.0, self.__maximum_transmission_time)
-            if message_transmission_time > 0.0:
-                break
-        if self.__next_transmission_time < self.__time.simulation_time:
-            self.__next_transmission_time = self.__time.simulation_time
-        packet_neighbors = \
-            self.__get_transmission_neighbors(self.__packet_counter,
-                                              self.__next_transmission_time,
-                                              neighbors)
-        # [ transmission start time,  transmission end time,
-        #   packet identifier,  (sending node identifier, message),
-        #   [ list of neighboring nodes ] ]
-        self.__transmitted_packets.append(
-            [self.__next_transmission_time,
-             self.__next_transmission_time + message_transmission_time,
-             self.__packet_counter,
-             (self.__node_id, message),
-             packet_neighbors])
+        # random() returns values from [0, 1), so the transmission time is
+        # drawn uniformly from (0, maximum_transmission_time].
+        message_transmission_time = self.__maximum_transmission_time \
+            * (1.0 - self.__random_generator.random())
+        simulation_time = self.__time.simulation_time
+        if self.__next_transmission_time < simulation_time:
+            self.__next_transmission_time = simulation_time
+        # the transmission may begin only if no earlier packet still waits
+        # for the beginning of its transmission
+        if self.__pending == len(self.__receivers) \
+                and self.__next_transmission_time \
+                <= simulation_time + self.__time.simulation_period:
+            self.__logger.debug('Node #%d: transmitting packet %d',
+                                self.__node_id, self.__packet_counter)
+            packet_neighbors = set(neighbors)
+        else:
+            packet_neighbors = None
+        self.__start_times.append(self.__next_transmission_time)
+        self.__end_times.append(self.__next_transmission_time
+                                + message_transmission_time)
+        self.__payloads.append((self.__node_id, message))
+        self.__receivers.append(packet_neighbors)
+        if packet_neighbors is not None:
+            self.__pending = len(self.__receivers)
         self.__next_transmission_time += message_transmission_time
-        # print self.__transmitted_packets
 
-    def transmit_packets(self, neighbors):
+    def send_messages(self, messages, neighbors):
         """
-        Transmits packets to neighboring nodes.
+        Sends application messages.  The effect is the same as calling the
+        :meth:`send_message` method for each of the messages in turn, but
+        packets are appended to the transmitted ones at once.
 
         *Parameters*:
+            - **messages** (`list`): a list of application messages to send of
+              any type;
             - **neighbors** (`list`): a list of identifiers of all neighboring
-              nodes of the sender at the current simulation step according to
-              the wireless signal propagation model used (see:
-              :mod:`sim2net.propagation`).
+              nodes of the sender at the current simulation step.
         """
         assert isinstance(neighbors, list) or isinstance(neighbors, tuple), \
             'Node #%d: an invalid type of the given list of neighbors!' \
             % self.__node_id
-        neighbors_set = set(neighbors)
-        for packet in self.__transmitted_packets:
-            if packet[-1] is None:
-                packet[-1] = \
-                    self.__get_transmission_neighbors(packet[2], packet[0],
-                                                      neighbors)
-            if packet[0] <= self.__time.simulation_time \
-                    and packet[1] >= self.__time.simulation_time:
-                assert packet[-1] is not None, \
-                    'Node #%d: the list of neighbors for packet %d is empty!' \
-                    % (self.__node_id, packet[2])
-                if packet[-1]:
-                    packet[-1] = list(set(packet[-1]) & neighbors_set)
-            # print packet
+        random = self.__random_generator.random
+        maximum_transmission_time = self.__maximum_transmission_time
+        simulation_time = self.__time.simulation_time
+        if self.__next_transmission_time < simulation_time:
+            self.__next_transmission_time = simulation_time
+        transmission_time = self.__next_transmission_time
+        # transmissions may begin only if no earlier packet is pending
+        begun = self.__pending == len(self.__receivers)
+        transmission_end = simulation_time + self.__time.simulation_period
+        start_times = array('d')
+        end_times = array('d')
+        payloads = list()
+        receivers = list()
+        for message in messages:
+            if not message:
+                self.__logger.error('Node #%d: discarding the empty message'
+                                    ' passed to send!' % self.__node_id)
+                continue
+            self.__packet_counter += 1
+            start_times.append(transmission_time)
+            begun = begun and transmission_time <= transmission_end
+            if begun:
+                self.__logger.debug('Node #%d: transmitting packet %d',
+                                    self.__node_id, self.__packet_counter)
+                packet_neighbors = set(neighbors)
+            else:
+                packet_neighbors = None
+            receivers.append(packet_neighbors)
+            transmission_time += \
+                maximum_transmission_time * (1.0 - random())
+            end_times.append(transmission_time)
+            payloads.append((self.__node_id, message))
+        if not payloads:
+            return
+        # packets which transmissions have begun precede the others
+        transmitted = len(receivers) - receivers.count(None)
+        if transmitted:
+            self.__pending = len(self.__receivers) + transmitted
+        self.__start_times.extend(start_times)
+        self.__end_times.extend(end_times)
+        self.__payloads.extend(payloads)
+        self.__receivers.extend(receivers)
+        self.__next_transmission_time = transmission_time
+
+    def transmit_packets(self, neighbors_set):
+        """
+        Transmits packets to neighboring nodes.
+
+        *Parameters*:
+            - **neighbors_set** (`frozenset`): a set of identifiers of all
+              neighboring nodes of the sender at the current simulation step
+              according to the wireless signal propagation model used (see:
+              :mod:`sim2net.propagation`).
+        """
+        assert isinstance(neighbors_set, frozenset) \
+            or isinstance(neighbors_set, set), \
+            'Node #%d: an invalid type of the given set of neighbors!' \
+            % self.__node_id
+        simulation_time = self.__time.simulation_time
+        start_times = self.__start_times
+        receivers = self.__receivers
+        first_packet_id = self.__first_packet_id
+        # packets which transmissions begin
+        last = bisect_right(start_times,
+                            simulation_time + self.__time.simulation_period,
+                            self.__pending)
+        for index in range(self.__pending, last):
+            self.__logger.debug('Node #%d: transmitting packet %d',
+                                self.__node_id, first_packet_id + index)
+            receivers[index] = set(neighbors_set)
+        self.__pending = last
+        # packets that are being transmitted
+        first = bisect_left(self.__end_times, simulation_time, self.__head)
+        last = bisect_right(start_times, simulation_time, first)
+        for index in range(first, last):
+            assert receivers[index] is not None, \
+                'Node #%d: the list of neighbors for packet %d is empty!' \
+                % (self.__node_id, first_packet_id + index)
+            if receivers[index]:
+                receivers[index].intersection_update(neighbors_set)
 
     def deliver_packet(self):
         """
@@ -187,7 +275,7 @@ class _Output(object):
                 * an identifier of the packet to deliver of type `int`;
                 * a `tuple` that contains an identifier of the sender of
                   type `int` and the transported application message;
-                * a list of identifiers of nodes which receive the packet.
+                * a `set` of identifiers of nodes which receive the packet.
 
         .. hint::
 
@@ -199,36 +287,53 @@ class _Output(object):
               :meth:`_Input.capture_packet` of input channels of all nodes
               receiving the packet.
         """
-        for packet_no in range(0, len(self.__transmitted_packets)):
-            packet = self.__transmitted_packets[0]
-            if packet[1] > self.__time.simulation_time:
-                return None
-            losses = [neighbor for neighbor in packet[-1]
-                      if self.__packet_loss.packet_loss()]
-            packet[-1] = list(set(packet[-1]) - set(losses))
-            if losses and self.__logger.isEnabledFor('DEBUG'):
-                msg = 'Node #%d: in accordance with the packet loss model' \
-                      ' packet %d was lost during transmission to node(s) #%s'
-                self.__logger.debug(msg %
-                                    (self.__node_id, packet[2],
-                                     ', #'.join(str(node) for node in losses)))
-            if not packet[-1]:
-                if self.__logger.isEnabledFor('DEBUG'):
-                    msg = 'Node #%d: no neighboring node is able to receive' \
-                          ' packet %d'
-                    self.__logger.debug(msg % (self.__node_id, packet[2]))
-                del self.__transmitted_packets[0]
+        # end times are ascending, so all packets to deliver are placed
+        # before the boundary
+        boundary = bisect_right(self.__end_times, self.__time.simulation_time,
+                                self.__head)
+        packet_losses = self.__packet_loss.packet_losses
+        while self.__head < boundary:
+            index = self.__head
+            self.__head += 1
+            packet_id = self.__first_packet_id + index
+            receivers = self.__receivers[index]
+            losses = [neighbor for neighbor, lost
+                      in zip(receivers, packet_losses(len(receivers)))
+                      if lost]
+            receivers.difference_update(losses)
+            if losses:
+                self.__logger.debug(
+                    'Node #%d: in accordance with the packet loss model'
+                    ' packet %d was lost during transmission to node(s) #%s',
+                    self.__node_id, packet_id,
+                    logger.LazyString(
+                        lambda: ', #'.join(str(node) for node in losses)))
+            if not receivers:
+                self.__logger.debug('Node #%d: no neighboring node is able to'
+                                    ' receive packet %d', self.__node_id,
+                                    packet_id)
                 continue
-            packet_out = (packet[2], packet[3], packet[-1])
-            del self.__transmitted_packets[0]
-            return packet_out
+            return (packet_id, self.__payloads[index], receivers)
+        if self.__head == len(self.__receivers) \
+                or self.__head > _Output.__MAXIMUM_DELIVERED_PACKETS:
+            self.__discard_delivered_packets()
+        return None
 
 
 class _Input(object):
     """
     This class implements input channels for nodes in the simulated network.
+
+    .. note::
+
+        The class declares empty slots, since two base classes with non-empty
+        slots cannot be combined in :class:`Channel`; the slots for its
+        attributes are declared by :class:`Channel` instead.  Therefore, the
+        class can be instantiated only through :class:`Channel`.
     """
 
+    __slots__ = ()
+
     def __init__(self, node_id):
         """
         *Parameters*:
@@ -242,7 +347,7 @@ class _Input(object):
         assert self.__random_generator is not None, \
             'A random generator object expected but "None" value got!'
         self.__node_id = node_id
-        self.__captured_packets = list()
+        self.__captured_packets = deque()
 
     def capture_packet(self, packet):
         """
@@ -257,10 +362,9 @@ class _Input(object):
         assert isinstance(packet, tuple) and len(packet) == 2, \
             'Invalid packet has been captured!'
         self.__captured_packets.append(packet[1])
-        if self.__logger.isEnabledFor('DEBUG'):
-            self.__logger.debug('Node #%s: packet %s from node %s has been'
-                                ' received' % (self.__node_id, packet[0],
-                                               packet[1][0]))
+        self.__logger.debug('Node #%s: packet %s from node %s has been'
+                            ' received', self.__node_id, packet[0],
+                            packet[1][0])
 
     def receive_message(self):
         """
@@ -272,7 +376,7 @@ class _Input(object):
             received application message.
         """
         try:
-            return self.__captured_packets.pop(0)
+            return self.__captured_packets.popleft()
         except IndexError:
             return None
 
@@ -296,6 +400,10 @@ class Channel(_Output, _Input):
     :meth:`_Input.receive_message` method.
     """
 
+    __slots__ = ('_Channel__logger', '_Input__logger',
+                 '_Input__random_generator', '_Input__node_id',
+                 '_Input__captured_packets')
+
     def __init__(self, time, packet_loss, node_id, maximum_transmission_time):
         """
         *Parameters*:
@@ -30,6 +30,10 @@ implemented, which serves as a communication interface for the simulated nodes.
 
 
 from copy import deepcopy
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from sim2net._channel import Channel
 from sim2net.utility import logger
@@ -38,23 +42,50 @@ from sim2net.utility import logger
 __docformat__ = 'reStructuredText'
 
 
+def clone_message(message):
+    """
+    Returns a copy of the given application message.  The message is copied by
+    serializing and deserializing it with the :mod:`pickle` module, which is
+    considerably faster than the :func:`copy.deepcopy` function; the latter is
+    used only for messages that cannot be serialized.
+
+    *Parameters*:
+        - **message**: the application message to copy of any type.
+
+    *Returns*:
+        A copy of the given message.
+    """
+    try:
+        return pickle.loads(pickle.dumps(message, pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return deepcopy(message)
+
+
 class _Communication(object):
     """
     This class implements a communication interface for the simulated nodes
     providing two methods for sending and receiving application messages.
     """
 
-    def __init__(self, node_id, send_message, receive_message):
+    __slots__ = ('_Communication__node_id', '_Communication__send_message',
+                 '_Communication__send_messages',
+                 '_Communication__receive_message')
+
+    def __init__(self, node_id, send_message, send_messages, receive_message):
         """
         *Parameters*:
             - **node_id** (`int`): an identifier of the node;
             - **send_message**: a sending method in the
               :class:`sim2net._network.Network` class;
+            - **send_messages**: a method in the
+              :class:`sim2net._network.Network` class for sending multiple
+              messages at once;
             - **receive_message**: a receiving method in the
               :class:`sim2net._network.Network` class.
         """
         self.__node_id = node_id
         self.__send_message = send_message
+        self.__send_messages = send_messages
         self.__receive_message = receive_message
 
     def send(self, message):
@@ -66,6 +97,18 @@ class _Communication(object):
         """
         self.__send_message(self.__node_id, message)
 
+    def send_messages(self, messages):
+        """
+        Sends application messages in the given order.  This is equivalent to
+        calling the :meth:`send` method for each of the messages, but is
+        faster for many messages sent at one simulation step.
+
+        *Parameters*:
+            - **messages** (`list`): a list of application messages to send of
+              any type.
+        """
+        self.__send_messages(self.__node_id, messages)
+
     def receive(self):
         """
         Returns None value if there is no message at the current simulation
@@ -92,13 +135,23 @@ class Network(object):
         'speed': None,  # a list of speed objects for all nodes
         'packet_loss': None}  #: a list of packet loss objects for all nodes
 
-    def __init__(self, environment):
+    __slots__ = ('_Network__logger', '_Network__network',
+                 '_Network__message_clone', '_Network__nodes_number',
+                 '_Network__nodes', '_Network__current_time')
+
+    def __init__(self, environment, message_clone=None):
         """
         *Parameters*:
             - **environment**: a dictionary that contains objects, which form
               the network environment for simulations (see
               :attr:`sim2net._network.Network.__ENVIRONMENT` for the objects
-              list).
+              list);
+            - **message_clone**: a function that takes an application message
+              and returns its copy to be sent (default:
+              :func:`sim2net._network.clone_message`); if all messages are
+              immutable (e.g. tuples of numbers and strings), the identity
+              function, ``lambda message: message``, can be used to avoid
+              copying at all.
         """
         self.__logger = logger.get_logger(Network.__name__)
         self.__logger.debug('Initializing the simulated network')
@@ -116,6 +169,9 @@ class Network(object):
         self.__network['mobility'] = environment['mobility']
         self.__network['propagation'] = environment['propagation']
         self.__network['failure'] = environment['failure']
+        if message_clone is None:
+            message_clone = clone_message
+        self.__message_clone = message_clone
         # NODES
         self.__nodes_number = len(environment['initial_coordinates'])
         self.__nodes = dict()
@@ -124,25 +180,28 @@ class Network(object):
         self.__nodes['neighbors'] = \
             self.__network['propagation'] \
                 .get_neighbors(self.__nodes['coordinates'])
+        self.__nodes['neighbor_sets'] = \
+            [frozenset(neighbors) for neighbors in self.__nodes['neighbors']]
         self.__nodes['channel'] = \
             [Channel(self.__network['time'], environment['packet_loss'][node],
                      node, environment['maximum_transmission_time'])
                 for node in range(0, self.__nodes_number)]
         self.__nodes['communication'] = \
             [_Communication(node, self.communication_send,
+                            self.communication_send_messages,
                             self.communication_receive)
                 for node in range(0, self.__nodes_number)]
         self.__nodes['failure'] = [False] * self.__nodes_number
+        self.__nodes['operative'] = list(range(0, self.__nodes_number))
         self.__network['shared'] = dict()
         self.__nodes['application'] = \
             [environment['application']()
                 for node in range(0, self.__nodes_number)]
-        self.__logger.debug('Initializing the "%s" application for %d nodes'
-                            % (environment['application'].__name__,
-                               self.__nodes_number))
-        for node in range(0, self.__nodes_number):
-            self.__nodes['application'][node].initialize(
-                node, self.__network['shared'])
+        self.__logger.debug('Initializing the "%s" application for %d nodes',
+                            environment['application'].__name__,
+                            self.__nodes_number)
+        for node, application in enumerate(self.__nodes['application']):
+            application.initialize(node, self.__network['shared'])
         self.__current_time = self.__network['time'].tick()
 
     def communication_send(self, node_id, message):
@@ -153,15 +212,37 @@ class Network(object):
             - **node_id** (`int`): an identifier of the sender;
             - **message**:  the application message to send of any type.
 
-        .. warning::
+        .. note::
 
-            This method uses the :func:`copy.deepcopy` function, and hence may
-            be slow.
+            The message is copied before sending with the function given as
+            the *message_clone* parameter (see:
+            :func:`sim2net._network.clone_message`).
 
         .. seealso:: :class:`sim2net._network._Communication`
         """
         self.__nodes['channel'][node_id].send_message(
-            deepcopy(message), self.__nodes['neighbors'][node_id])
+            self.__message_clone(message), self.__nodes['neighbors'][node_id])
+
+    def communication_send_messages(self, node_id, messages):
+        """
+        Sends application messages.
+
+        *Parameters*:
+            - **node_id** (`int`): an identifier of the sender;
+            - **messages** (`list`): a list of application messages to send of
+              any type.
+
+        .. note::
+
+            Each message is copied before sending in the same way as in the
+            :meth:`communication_send` method.
+
+        .. seealso:: :class:`sim2net._network._Communication`
+        """
+        message_clone = self.__message_clone
+        self.__nodes['channel'][node_id].send_messages(
+            [message_clone(message) for message in messages],
+            self.__nodes['neighbors'][node_id])
 
     def communication_receive(self, node_id):
         """
@@ -187,9 +268,17 @@ class Network(object):
         """
         failures = \
             self.__network['failure'].node_failure(self.__nodes['failure'])
+        if not failures:
+            return
+        # identifiers of operative nodes change only when nodes fail
+        failed = self.__nodes['failure']
+        self.__nodes['operative'] = \
+            [node for node in range(0, self.__nodes_number)
+             if not failed[node]]
+        applications = self.__nodes['application']
         for failure in failures:
-            self.__nodes['application'][failure].failure(
-                self.__current_time, self.__network['shared'])
+            applications[failure].failure(self.__current_time,
+                                          self.__network['shared'])
 
     def __move(self):
         """
@@ -198,11 +287,8 @@ class Network(object):
 
         .. seealso:: :mod:`sim2net.mobility`
         """
-        for node in range(0, self.__nodes_number):
-            self.__nodes['coordinates'][node] = \
-                self.__network['mobility'].get_current_position(
-                    node, self.__nodes['speed'][node],
-                    self.__nodes['coordinates'][node])
+        self.__network['mobility'].get_current_positions(
+            self.__nodes['speed'], self.__nodes['coordinates'])
 
     def __neighborhood(self):
         """
@@ -210,17 +296,17 @@ class Network(object):
 
         .. seealso:: :mod:`sim2net.propagation`
         """
-        self.__nodes['neighbors'] = \
+        neighbors = \
             self.__network['propagation'] \
                 .get_neighbors(self.__nodes['coordinates'])
-        # print self.__nodes['neighbors']
-        for node in range(0, self.__nodes_number):
-            failures = [neighbor for neighbor in
-                        self.__nodes['neighbors'][node]
-                        if self.__nodes['failure'][neighbor]]
-            self.__nodes['neighbors'][node] = \
-                list(set(self.__nodes['neighbors'][node]) - set(failures))
-        # print self.__nodes['neighbors']
+        if len(self.__nodes['operative']) < self.__nodes_number:
+            failure = self.__nodes['failure']
+            neighbors = [[neighbor for neighbor in node_neighbors
+                          if not failure[neighbor]]
+                         for node_neighbors in neighbors]
+        self.__nodes['neighbors'] = neighbors
+        self.__nodes['neighbor_sets'] = \
+            [frozenset(node_neighbors) for node_neighbors in neighbors]
 
     def __communication(self):
         """
@@ -229,17 +315,19 @@ class Network(object):
 
         .. seealso:: :class:`sim2net._channel.Channel`
         """
-        for node in range(0, self.__nodes_number):
-            self.__nodes['channel'][node].transmit_packets(
-                self.__nodes['neighbors'][node])
-        for node in range(0, self.__nodes_number):
+        # Delivery of packets of a node depends only on the state of its own
+        # output channel, so both transmission and delivery are performed in
+        # one pass over the nodes.
+        channels = self.__nodes['channel']
+        for channel, neighbors_set \
+                in zip(channels, self.__nodes['neighbor_sets']):
+            channel.transmit_packets(neighbors_set)
             while True:
-                packet = self.__nodes['channel'][node].deliver_packet()
+                packet = channel.deliver_packet()
                 if packet is None:
                     break
                 for receiver in packet[-1]:
-                    self.__nodes['channel'][receiver].capture_packet(
-                        (packet[0], packet[1]))
+                    channels[receiver].capture_packet((packet[0], packet[1]))
 
     def __application(self):
         """
@@ -248,11 +336,14 @@ class Network(object):
 
         .. seealso:: :class:`sim2net.application`
         """
-        for node in range(0, self.__nodes_number):
-            if not self.__nodes['failure'][node]:
-                self.__nodes['application'][node].main(
-                    self.__current_time, self.__nodes['communication'][node],
-                    self.__nodes['neighbors'][node], self.__network['shared'])
+        current_time = self.__current_time
+        shared = self.__network['shared']
+        applications = self.__nodes['application']
+        communications = self.__nodes['communication']
+        neighbors = self.__nodes['neighbors']
+        for node in self.__nodes['operative']:
+            applications[node].main(current_time, communications[node],
+                                    neighbors[node], shared)
 
     def step(self):
         """
@@ -279,6 +370,6 @@ class Network(object):
         Calls the :func:`sim2net.application.Application.finalize` finalization
         method at each node after all simulation steps.
         """
-        for node in range(0, self.__nodes_number):
-            self.__nodes['application'][node].finalize(
-                self.__network['shared'])
+        shared = self.__network['shared']
+        for application in self.__nodes['application']:
+            application.finalize(shared)
@@ -36,6 +36,8 @@ In this module the following terminology is used:
         a constant such that: :math:`T_s=\\frac{1}{f_s}`.
 """
 
+import logging
+
 from sim2net.utility import logger
 from sim2net.utility.validation import check_argument_type
 
@@ -54,6 +56,11 @@ class Time(object):
     #: A value by which the simulation step advances.
     __SIMULATION_TICK = 1
 
+    __slots__ = ('_Time__logger', '_Time__simulation_step',
+                 '_Time__simulation_time', '_Time__simulation_frequency',
+                 '_Time__simulation_period', '_Time__tick_result',
+                 '_Time__log_debug', '_Time__log')
+
     def __init__(self):
         """
         .. warning::
@@ -113,20 +120,27 @@ class Time(object):
                'A logger object expected but "None" value got!'
         self.__simulation_step = int(-1)
         self.__simulation_time = float(-1.0)
-        check_argument_type(Time.__name__, 'simulation_frequency', int,
-                            simulation_frequency, self.__logger)
+        self.__tick_result = [self.__simulation_step, self.__simulation_time]
+        if __debug__ and not isinstance(simulation_frequency, int):
+            check_argument_type(Time.__name__, 'simulation_frequency', int,
+                                simulation_frequency, self.__logger)
         if simulation_frequency <= 0:
             raise ValueError('Parameter "simulation_frequency": a value of' \
                              ' the simulation frequency parameter cannot be' \
                              ' less or equal to zero, but %d given!' %
                              int(simulation_frequency))
-        self.__simulation_frequency = float(simulation_frequency)
-        self.__simulation_period = 1.0 / self.__simulation_frequency
-        self.__logger.debug('The simulation time has been initialized with' \
-                            ' the simulation frequency set to %d and the' \
-                            ' simulation period equal to %f' %
-                            (self.__simulation_frequency,
-                             self.__simulation_period))
+        self.__simulation_frequency = int(simulation_frequency)
+        self.__simulation_period = 1.0 / float(simulation_frequency)
+        self.__logger.debug('The simulation time has been initialized with'
+                            ' the simulation frequency set to %d and the'
+                            ' simulation period equal to %f',
+                            self.__simulation_frequency,
+                            self.__simulation_period)
+        # the logging level is checked only once, since tick() is called at
+        # each simulation step
+        self.__log_debug = \
+            __debug__ and self.__logger.isEnabledFor(logging.DEBUG)
+        self.__log = self.__logger.debug
 
     def __str__(self):
         """
@@ -160,7 +174,7 @@ class Time(object):
         """
         (*Property*)  The simulation frequency of type `int`.
         """
-        return int(self.__simulation_frequency)
+        return self.__simulation_frequency
 
     @property
     def simulation_period(self):
@@ -181,12 +195,130 @@ class Time(object):
 
             The first call to this method will always returns ``(0, 0.0)``.
         """
-        self.__simulation_step += Time.__SIMULATION_TICK
-        self.__simulation_time = \
-            self.__simulation_step / self.__simulation_frequency
-        if __debug__ and self.__logger.isEnabledFor('DEBUG'):
-            self.__logger.debug('Tick: the current simulation step is %d' \
-                                ' and the current simulation time is %.9f' %
-                                (self.__simulation_step,
-                                 self.__simulation_time))
-        return (self.__simulation_step, self.__simulation_time)
+        simulation_step = self.__simulation_step + Time.__SIMULATION_TICK
+        # multiplication by the simulation period, which is constant after
+        # the set up, is cheaper than division by the simulation frequency
+        simulation_time = simulation_step * self.__simulation_period
+        self.__simulation_step = simulation_step
+        self.__simulation_time = simulation_time
+        if self.__log_debug:
+            self.__log('Tick: the current simulation step is %d and the'
+                       ' current simulation time is %.9f', simulation_step,
+                       simulation_time)
+        return (simulation_step, simulation_time)
+
+    def tick_fast(self):
+        """
+        Advances the simulation step and time values in the same way as the
+        :meth:`tick` method does, but without allocating a new tuple at each
+        call.
+
+        *Returns*:
+            A list of two values: the current simulation step (`int`) and the
+            current simulation time (`float`).
+
+        .. warning::
+
+            The same list object is returned and updated in place by all calls
+            to this method, so it must not be kept between simulation steps;
+            use the :meth:`tick` method if the values are to be stored.
+
+        *Examples*:
+
+        .. testsetup::
+
+            from sim2net._time import Time
+
+        .. doctest::
+
+            >>> clock = Time()
+            >>> clock.setup()
+            >>> first = clock.tick_fast()
+            >>> first
+            [0, 0.0]
+            >>> second = clock.tick_fast()
+            >>> second
+            [1, 1.0]
+            >>> first is second
+            True
+            >>> first
+            [1, 1.0]
+        """
+        simulation_step = self.__simulation_step + Time.__SIMULATION_TICK
+        simulation_time = simulation_step * self.__simulation_period
+        self.__simulation_step = simulation_step
+        self.__simulation_time = simulation_time
+        if self.__log_debug:
+            self.__log('Tick: the current simulation step is %d and the'
+                       ' current simulation time is %.9f', simulation_step,
+                       simulation_time)
+        result = self.__tick_result
+        result[0] = simulation_step
+        result[1] = simulation_time
+        return result
+
+    def ticks(self, steps_number):
+        """
+        Advances the simulation step and time values by the given number of
+        simulation steps at once.
+
+        *Parameters*:
+            - **steps_number** (`int`): a number of simulation steps to advance
+              (greater than 0).
+
+        *Returns*:
+            A tuple of two lists of the same length equal to *steps_number*:
+            successive simulation steps (`int`) and corresponding simulation
+            times (`float`), as they would be returned by the same number of
+            calls to the :meth:`tick` method.
+
+        *Raises*:
+            - **ValueError**: raised when a given number of steps is less or
+              equal to 0.
+
+        *Examples*:
+
+        .. testsetup::
+
+            from sim2net._time import Time
+
+        .. doctest::
+
+            >>> clock = Time()
+            >>> clock.setup(4)
+            >>> clock.ticks(3)
+            ([0, 1, 2], [0.0, 0.25, 0.5])
+            >>> clock.tick()
+            (3, 0.75)
+
+            >>> clock = Time()
+            >>> clock.setup(4)
+            >>> clock.tick()
+            (0, 0.0)
+            >>> clock.tick()
+            (1, 0.25)
+            >>> clock.tick()
+            (2, 0.5)
+            >>> clock.tick()
+            (3, 0.75)
+        """
+        if __debug__ and not isinstance(steps_number, int):
+            check_argument_type(Time.__name__, 'steps_number', int,
+                                steps_number, self.__logger)
+        if steps_number <= 0:
+            raise ValueError('Parameter "steps_number": a number of'
+                             ' simulation steps cannot be less or equal to'
+                             ' zero, but %d given!' % steps_number)
+        first_step = self.__simulation_step + Time.__SIMULATION_TICK
+        steps = list(range(first_step,
+                           first_step + steps_number * Time.__SIMULATION_TICK,
+                           Time.__SIMULATION_TICK))
+        simulation_period = self.__simulation_period
+        times = [step * simulation_period for step in steps]
+        self.__simulation_step = steps[-1]
+        self.__simulation_time = times[-1]
+        if self.__log_debug:
+            self.__log('Ticks: the current simulation step is %d and the'
+                       ' current simulation time is %.9f',
+                       self.__simulation_step, self.__simulation_time)
+        return (steps, times)
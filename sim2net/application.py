@@ -17,9 +17,6 @@
 """
 
 
-from abc import ABCMeta, abstractmethod
-
-
 __docformat__ = 'reStructuredText'
 
 
@@ -28,8 +25,6 @@ class Application(object):
     """
     """
 
-    __metaclass__ = ABCMeta
-
     def initialize(self, node_id, shared):
         """
         """
@@ -19,8 +19,6 @@ classes.
 """
 
 
-from abc import ABCMeta, abstractmethod, abstractproperty
-
 from sim2net.utility import logger
 
 
@@ -34,16 +32,33 @@ class Area(object):
     simulation area classes.
     """
 
-    __metaclass__ = ABCMeta
-
     #: The origin for simulation areas.
     ORIGIN = (0.0, 0.0)
 
+    #: Names of methods and properties that must be implemented by all
+    #: simulation area classes.
+    __ABSTRACT_MEMBERS = ('height', 'width', 'within', 'get_area')
+
+    __slots__ = ('_Area__logger',)
+
     def __init__(self, name):
         """
         *Parameters*:
             - **name** (`str`): a name of the implemented simulation area.
+
+        *Raises*:
+            - **TypeError**: raised when the simulation area class does not
+              implement all abstract methods and properties of this class.
         """
+        # abstract members are checked once here instead of using the
+        # ABCMeta metaclass
+        missing = [member for member in Area.__ABSTRACT_MEMBERS
+                   if [cls for cls in type(self).__mro__
+                       if member in vars(cls)][0] is Area]
+        if missing:
+            raise TypeError('Can\'t instantiate abstract class %s with'
+                            ' abstract methods %s'
+                            % (type(self).__name__, ', '.join(missing)))
         self.__logger = logger.get_logger('area.' + str(name))
         assert self.__logger is not None, \
             'A logger object expected but "None" value got!'
@@ -58,7 +73,7 @@ class Area(object):
         """
         return self.__logger
 
-    @abstractproperty
+    @property
     def height(self):
         """
         (*Property*)  A height of the simulation area of type `float`.
@@ -69,7 +84,7 @@ class Area(object):
         raise NotImplementedError('The abstract class "Area" has no'
                                   ' implementation of the "height" property!')
 
-    @abstractproperty
+    @property
     def width(self):
         """
         (*Property*)  A width of the simulation area of type `float`.
@@ -80,7 +95,6 @@ class Area(object):
         raise NotImplementedError('The abstract class "Area" has no'
                                   ' implementation of the "width" property!')
 
-    @abstractmethod
     def within(self, horizontal_coordinate, vertical_coordinate):
         """
         Tests whether the given coordinates are within the simulation area.
@@ -101,7 +115,6 @@ class Area(object):
         raise NotImplementedError('The abstract class "Area" has no'
                                   ' implementation of the "within()" method!')
 
-    @abstractmethod
     def get_area(self):
         """
         Creates a dictionary that stores information about the simulation area.
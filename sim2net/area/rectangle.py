@@ -31,6 +31,12 @@ class Rectangle(Area):
     the two-dimensional space with the origin in (0, 0).
     """
 
+    #: The name of the simulation area.
+    __AREA_NAME = 'rectangle'
+
+    __slots__ = ('_Rectangle__width', '_Rectangle__height',
+                 '_Rectangle__area_information')
+
     def __init__(self, width, height):
         """
         *Parameters*:
@@ -44,20 +50,48 @@ class Rectangle(Area):
               **height** parameter is equal to or less than 0.
         """
         super(Rectangle, self).__init__(Rectangle.__name__)
-        check_argument_type(Rectangle.__name__, 'width', float, width,
-                            self.logger)
+        # the validation function is called only to report an inappropriate
+        # type, and the checks are skipped in the optimized mode
+        if __debug__ and not isinstance(width, float):
+            check_argument_type(Rectangle.__name__, 'width', float, width,
+                                self.logger)
         if width <= 0:
             raise ValueError('Parameter "width": the width of a simulation'
                              ' area cannot be equal to or less than 0, but'
                              ' %d given!' % float(width))
-        self.__width = float(width)
-        check_argument_type(Rectangle.__name__, 'height', float, height,
-                            self.logger)
+        if __debug__ and not isinstance(height, float):
+            check_argument_type(Rectangle.__name__, 'height', float, height,
+                                self.logger)
         if height <= 0:
             raise ValueError('Parameter "height": the height of a simulation'
                              ' area cannot be equal to or less than 0, but'
                              ' %d given!' % float(height))
+        self._init(width, height)
+
+    def _init(self, width, height, area_information=None):
+        """
+        Sets the size of the simulation area without validating it.  This
+        method is intended for subclasses that validate the size by
+        themselves (see: :class:`sim2net.area.square.Square`).
+
+        *Parameters*:
+            - **width** (`float`): a width of the rectangular simulation area
+              (along the horizontal x-axis),
+            - **height** (`float`): a height of the rectangular simulation area
+              (along the vertical y-axis),
+            - **area_information** (`dict`): a dictionary to be returned by
+              the :meth:`get_area` method (default: `None`, which means the
+              information about the rectangular simulation area).
+        """
+        self.__width = float(width)
         self.__height = float(height)
+        # the size of the area does not change, so the information about it
+        # is created only once
+        if area_information is None:
+            area_information = {'area name': Rectangle.__AREA_NAME,
+                                'width': self.__width,
+                                'height': self.__height}
+        self.__area_information = area_information
 
     @property
     def height(self):
@@ -87,16 +121,36 @@ class Rectangle(Area):
             (`bool`) `True` if the given coordinates are within the rectangular
             simulation area, or `False` otherwise.
         """
-        if horizontal_coordinate < 0.0 or vertical_coordinate < 0.0:
-            return False
-        if horizontal_coordinate <= self.__width \
-                and vertical_coordinate <= self.__height:
-            return True
-        return False
+        return 0.0 <= horizontal_coordinate <= self.__width \
+            and 0.0 <= vertical_coordinate <= self.__height
+
+    def within_all(self, horizontal_coordinates, vertical_coordinates):
+        """
+        Tests whether the given points are within the simulation area.  The
+        result is the same as calling the :meth:`within` method for each
+        point, but the bounds of the area are read only once.
+
+        *Parameters*:
+            - **horizontal_coordinates** (`list`): horizontal (x-axis)
+              coordinates of the points;
+            - **vertical_coordinates** (`list`): vertical (y-axis) coordinates
+              of the points.
+
+        *Returns*:
+            (`list`) a list of `bool` values; `True` in position :math:`i`
+            indicates that point number :math:`i` is within the rectangular
+            simulation area.
+        """
+        width = self.__width
+        height = self.__height
+        return [0.0 <= horizontal_coordinate <= width
+                and 0.0 <= vertical_coordinate <= height
+                for horizontal_coordinate, vertical_coordinate
+                in zip(horizontal_coordinates, vertical_coordinates)]
 
     def get_area(self):
         """
-        Creates a dictionary that stores information about the simulation area.
+        Returns a dictionary that stores information about the simulation area.
 
         *Returns*:
             A dictionary that stores information about the simulation area;
@@ -105,7 +159,10 @@ class Rectangle(Area):
                 - 'area name': a name of the simulation area of type `str`,
                 - 'width': a width of the simulation area of type `float`,
                 - 'height': a height of the simulation area of type `float`.
+
+        .. note::
+
+            The same dictionary is returned by all calls to this method, so it
+            should not be modified.
         """
-        return {'area name': self.__class__.__name__.lower(),
-                'width': self.__width,
-                'height': self.__height}
+        return self.__area_information
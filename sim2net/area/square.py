@@ -20,6 +20,7 @@ space.
 
 
 from sim2net.area.rectangle import Rectangle
+from sim2net.utility.validation import check_argument_type
 
 
 __docformat__ = 'reStructuredText'
@@ -31,22 +32,44 @@ class Square(Rectangle):
     two-dimensional space with the origin in (0, 0).
     """
 
+    #: The name of the simulation area.
+    __AREA_NAME = 'square'
+
+    __slots__ = ()
+
     def __init__(self, side):
         """
         *Parameters*:
             - **side** (`float`): a side length of the square simulation area.
 
+        *Raises*:
+            - **ValueError**: raised when a given value of the **side**
+              parameter is equal to or less than 0.
+
         .. note::
 
-            In this case, the :meth:`sim2net.area.rectangle.Rectangle` method
-            is called with the **width** and **height** parameters set to the
-            value of the given **side** argument.
+            In this case, the size of the area is set with the
+            :meth:`sim2net.area.rectangle.Rectangle._init` method called with
+            the **width** and **height** parameters set to the value of the
+            given **side** argument, together with the information about the
+            square simulation area.
         """
-        super(Square, self).__init__(side, side)
+        # the side is validated only once here, so the constructor of the
+        # Rectangle class, which would validate it twice, is bypassed
+        super(Rectangle, self).__init__(Rectangle.__name__)
+        if __debug__ and not isinstance(side, float):
+            check_argument_type(Square.__name__, 'side', float, side,
+                                self.logger)
+        if side <= 0:
+            raise ValueError('Parameter "side": the side length of a'
+                             ' simulation area cannot be equal to or less than'
+                             ' 0, but %d given!' % float(side))
+        self._init(side, side,
+                   {'area name': Square.__AREA_NAME, 'side': float(side)})
 
     def get_area(self):
         """
-        Creates a dictionary that stores information about the simulation area.
+        Returns a dictionary that stores information about the simulation area.
 
         *Returns*:
             A dictionary that stores information about the simulation area;
@@ -55,6 +78,10 @@ class Square(Rectangle):
                 - 'area name': a name of the simulation area of type `str`,
                 - 'side': a side length of the square simulation area of type
                   `float`.
+
+        .. note::
+
+            The same dictionary is returned by all calls to this method, so it
+            should not be modified.
         """
-        return {'area name': self.__class__.__name__.lower(),
-                'side': self.width}
+        return super(Square, self).get_area()
@@ -72,3 +72,6 @@ maximum_transmission_time = 0.125
 ## failure
 failure = [Crash, {'crash_probability': 0.1, 'maximum_crash_number': 0,
                    'transient_steps': 0}]
+
+## messages (copied before sending; uncomment for immutable messages only)
+#message_clone = lambda message: message
@@ -61,7 +61,7 @@ both files as arguments, eg.::
 
 import argparse
 
-from os.path import join, realpath, split
+from os.path import getmtime, join, realpath, split
 from shutil import copy
 from sys import argv, exit, stdout
 from traceback import print_exc
@@ -90,6 +90,31 @@ LICENSE ALONG WITH THIS SOFTWARE; IF NOT, YOU CAN DOWNLOAD A COPY FROM
 HTTP://WWW.OPENSOURCE.ORG.
 """ % project_information()
 
+#: Compiled configuration files indexed by their paths and modification times.
+__COMPILED_CONFIGURATIONS = dict()
+
+
+def __read_configuration(path):
+    """
+    Executes the given configuration file and returns its variables.  The file
+    is compiled only once for as long as it is not modified.
+
+    *Parameters*:
+        - **path** (`str`): a path to the configuration file.
+
+    *Returns*:
+        A dictionary with variables defined in the configuration file.
+    """
+    key = (path, getmtime(path))
+    code = __COMPILED_CONFIGURATIONS.get(key)
+    if code is None:
+        with open(path) as configuration_file:
+            code = compile(configuration_file.read(), path, 'exec')
+        __COMPILED_CONFIGURATIONS[key] = code
+    configuration = dict()
+    exec(code, configuration)
+    return configuration
+
 
 def main():
     """
@@ -160,8 +185,7 @@ def main():
         print 'sim2net: error: expected two arguments'
         exit(__POSIX_EXIT_FAILURE)
     try:
-        configuration = dict()
-        execfile(vars(args)['configuration'], configuration)
+        configuration = __read_configuration(vars(args)['configuration'])
         sim2net = Sim2Net(configuration, vars(args)['application'])
         args = None
         configuration = None
@@ -37,38 +37,26 @@ class Failure(object):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ('random_generator', 'logger')
+
     def __init__(self, name):
         """
         *Parameters*:
             - **name** (`str`): a name of the implemented process failure
               model.
         """
-        self.__random_generator = get_random_generator()
-        assert self.__random_generator is not None, \
+        #: An object representing the
+        #: :class:`sim2net.utility.randomness._Randomness` pseudo-random number
+        #: generator.
+        self.random_generator = get_random_generator()
+        assert self.random_generator is not None, \
             'A random generator object expected but "None" value got!'
-        self.__logger = logger.get_logger('failure.' + str(name))
-        assert self.__logger is not None, \
+        #: A logger object of the :class:`logging.Logger` class with an
+        #: appropriate channel name (see: :mod:`sim2net.utility.logger`).
+        self.logger = logger.get_logger('failure.' + str(name))
+        assert self.logger is not None, \
             'A logger object expected but "None" value got!'
 
-    @property
-    def random_generator(self):
-        """
-        (*Property*)  An object representing the
-        :class:`sim2net.utility.randomness._Randomness` pseudo-random number
-        generator.
-        """
-        return self.__random_generator
-
-    @property
-    def logger(self):
-        """
-        (*Property*)  A logger object of the :class:`logging.Logger` class with
-        an appropriate channel name.
-
-        .. seealso::  :mod:`sim2net.utility.logger`
-        """
-        return self.__logger
-
     @abstractmethod
     def node_failure(self, failures):
         """
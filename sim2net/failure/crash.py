@@ -29,6 +29,9 @@ the total number of faulty processes can also be limited to a given value.
 
 
 import operator
+from array import array
+from bisect import bisect_right
+from math import log, log1p
 
 from sim2net.failure._failure import Failure
 from sim2net.utility.validation import check_argument_type
@@ -48,6 +51,9 @@ class Crash(Failure):
         step of the simulation.
     """
 
+    __slots__ = ('_Crash__time', '_Crash__crashed_nodes',
+                 '_Crash__crash_steps', '_Crash__next_crash')
+
     def __init__(self, time, nodes_number, crash_probability,
                  maximum_crash_number, total_simulation_steps,
                  transient_steps=0):
@@ -115,10 +121,17 @@ class Crash(Failure):
                              ' greater than the total number of simulation'
                              ' steps but %d given!' % int(transient_steps))
         self.__time = time
-        self.__crashed = \
-            self.__crashes(int(nodes_number),
-                           float(crash_probability), int(maximum_crash_number),
-                           int(total_simulation_steps), int(transient_steps))
+        crashes = self.__crashes(int(nodes_number), float(crash_probability),
+                                 int(maximum_crash_number),
+                                 int(total_simulation_steps),
+                                 int(transient_steps))
+        # Crashes are kept in two parallel sequences sorted by crash times:
+        # identifiers of nodes and their times of crash (in simulation
+        # steps).  Crashes before the __next_crash position have already
+        # occurred.
+        self.__crashed_nodes = array('l', [crash[0] for crash in crashes])
+        self.__crash_steps = array('l', [crash[1] for crash in crashes])
+        self.__next_crash = 0
 
     def __crashes(self, nodes_number, crash_probability, maximum_crash_number,
                   total_simulation_steps, transient_steps):
@@ -146,28 +159,43 @@ class Crash(Failure):
             with faulty process and its time of crash (in simulation steps).
             The list is sorted in ascending order by crash times.
         """
-        if maximum_crash_number == 0:
+        if crash_probability == 0.0 or maximum_crash_number == 0 \
+                or nodes_number == 0:
             return []
-        crashes = [-1] * nodes_number
-        crashes_number = 0
-        for node_id in xrange(nodes_number):
-            crash = self.random_generator.uniform(0.0, 1.0)
-            if crash <= crash_probability:
-                crashes[node_id] = \
-                    self.random_generator.uniform(0.0 + transient_steps,
-                                                  total_simulation_steps)
-                crashes_number = crashes_number + 1
-                if crashes_number == maximum_crash_number:
+        uniform = self.random_generator.uniform
+        if crash_probability >= 1.0:
+            # every process crashes, so no per-node draws are needed
+            crashes = [uniform(0.0 + transient_steps, total_simulation_steps)
+                       for _ in range(0, min(nodes_number,
+                                             maximum_crash_number))]
+        else:
+            # Instead of a Bernoulli trial for each process, the numbers of
+            # trials between consecutive crashes are drawn from the geometric
+            # distribution, which takes one draw per faulty process.
+            # The gap is kept as a float until it is known to fall within the
+            # remaining processes, as it may be infinite for crash
+            # probabilities close to zero.
+            random = self.random_generator.random
+            log_survival = log1p(-crash_probability)
+            crashes = list()
+            trial = -1
+            while len(crashes) < maximum_crash_number:
+                gap = log(1.0 - random()) / log_survival
+                if gap >= nodes_number - trial - 1:
                     break
-        self.random_generator.random_order(crashes)
-        crashed = dict()
-        for node_id in xrange(nodes_number):
-            if crashes[node_id] > 0:
-                crashed[node_id] = int(crashes[node_id])
+                trial += int(gap) + 1
+                crashes.append(
+                    uniform(0.0 + transient_steps, total_simulation_steps))
+        # the times of crash are assigned to randomly chosen nodes
+        node_ids = self.random_generator.sample(range(0, nodes_number),
+                                                len(crashes))
+        crashed = [(node_id, int(crash))
+                   for node_id, crash in zip(node_ids, crashes) if crash > 0]
         assert len(crashed) <= maximum_crash_number, \
             'The number of faulty process (%d) is greater then the maximum' \
-            ' value (%d)!' % (len(crashes), maximum_crash_number)
-        return sorted(crashed.iteritems(), key=operator.itemgetter(1))
+            ' value (%d)!' % (len(crashed), maximum_crash_number)
+        crashed.sort(key=operator.itemgetter(1))
+        return crashed
 
     def node_failure(self, failures):
         """
@@ -205,13 +233,13 @@ class Crash(Failure):
             (0, 0.0)
             >>> crash.node_failure(failures)
             []
-            >>> print failures
+            >>> print(failures)
             [False, False, False, False]
             >>> clock.tick()
             (1, 1.0)
             >>> crash.node_failure(failures)
             []
-            >>> print failures
+            >>> print(failures)
             [False, False, False, False]
 
             >>> clock = Time()
@@ -222,25 +250,46 @@ class Crash(Failure):
             (0, 0.0)
             >>> crash.node_failure(failures)
             []
-            >>> print failures
+            >>> print(failures)
             [False, False, False, False]
             >>> clock.tick()
             (1, 1.0)
             >>> crash.node_failure(failures)
             []
-            >>> print failures
+            >>> print(failures)
             [False, False, False, False]
 
+        Crash probabilities too small to be represented as a difference from
+        one are also accepted.
+
+        .. doctest::
+
+            >>> clock = Time()
+            >>> clock.setup()
+            >>> crash = Crash(clock, 10, 1e-17, 5, 100)
+            >>> crash = Crash(clock, 10, 5e-324, 5, 100)
+            >>> failures = [False] * 10
+            >>> clock.tick()
+            (0, 0.0)
+            >>> crash.node_failure(failures)
+            []
+
         """
-        crashes = list()
-        while self.__crashed:
-            if self.__crashed[0][1] <= self.__time.simulation_step:
-                failures[self.__crashed[0][0]] = True
-                crashes.append(self.__crashed[0][0])
-                self.logger.debug('In accordance with the node failure model'
-                                  ' node #%d has failed'
-                                  % self.__crashed[0][0])
-                self.__crashed.pop(0)
-            else:
-                break
+        first = self.__next_crash
+        crash_steps = self.__crash_steps
+        # no crashes are scheduled or all of them have already occurred
+        if first == len(crash_steps):
+            return []
+        simulation_step = self.__time.simulation_step
+        # usually no crash is due, which takes a single comparison to tell
+        if crash_steps[first] > simulation_step:
+            return []
+        last = bisect_right(crash_steps, simulation_step, first + 1)
+        self.__next_crash = last
+        crashes = self.__crashed_nodes[first:last].tolist()
+        debug = self.logger.debug
+        for node_id in crashes:
+            failures[node_id] = True
+            debug('In accordance with the node failure model node #%d has'
+                  ' failed', node_id)
         return crashes
@@ -37,37 +37,25 @@ class Mobility(object):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ('random_generator', 'logger')
+
     def __init__(self, name):
         """
         *Parameters*:
             - **name** (`str`): a name of the implemented mobility model.
         """
-        self.__random_generator = get_random_generator()
-        assert self.__random_generator is not None, \
+        #: An object representing the
+        #: :class:`sim2net.utility.randomness._Randomness` pseudo-random number
+        #: generator.
+        self.random_generator = get_random_generator()
+        assert self.random_generator is not None, \
                'A random generator object expected but "None" value got!'
-        self.__logger = logger.get_logger('mobility.' + str(name))
-        assert self.__logger is not None, \
+        #: A logger object of the :class:`logging.Logger` class with an
+        #: appropriate channel name (see: :mod:`sim2net.utility.logger`).
+        self.logger = logger.get_logger('mobility.' + str(name))
+        assert self.logger is not None, \
                'A logger object expected but "None" value got!'
 
-    @property
-    def random_generator(self):
-        """
-        (*Property*)  An object representing the
-        :class:`sim2net.utility.randomness._Randomness` pseudo-random number
-        generator.
-        """
-        return self.__random_generator
-
-    @property
-    def logger(self):
-        """
-        (*Property*)  A logger object of the :class:`logging.Logger` class with
-        an appropriate channel name.
-
-        .. seealso::  :mod:`sim2net.utility.logger`
-        """
-        return self.__logger
-
     @abstractmethod
     def get_current_position(self, node_id, node_speed, node_coordinates):
         """
@@ -91,3 +79,29 @@ class Mobility(object):
         raise NotImplementedError('The abstract class "Mobility" has no' \
                                   ' implementation of the' \
                                   ' "get_current_position()" method!')
+
+    def get_current_positions(self, nodes_speed, nodes_coordinates):
+        """
+        Calculates positions of all nodes at the current simulation step in
+        accordance with the implemented mobility model, and stores them *in
+        place* in the given list of coordinates.  It is assumed that this
+        method is called at each step of the simulation instead of the
+        :meth:`get_current_position` method.
+
+        The default implementation calls the :meth:`get_current_position`
+        method for each node in ascending order of identifiers.  Mobility
+        models that can compute positions of all nodes at once faster may
+        override this method.
+
+        *Parameters*:
+            - **nodes_speed** (`list`): objects representing speeds of all
+              nodes;
+            - **nodes_coordinates** (`list`): values of horizontal and
+              vertical coordinates of all nodes at the previous simulation
+              step; the values are replaced with the current coordinates.
+        """
+        get_current_position = self.get_current_position
+        for node_id in range(0, len(nodes_coordinates)):
+            nodes_coordinates[node_id] = \
+                get_current_position(node_id, nodes_speed[node_id],
+                                     nodes_coordinates[node_id])
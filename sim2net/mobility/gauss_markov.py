@@ -62,6 +62,7 @@ random variables (:math:`v_x` and :math:`d_x`).
 """
 
 
+import logging
 from math import cos, fabs, pi, sin, sqrt
 
 from sim2net.mobility._mobility import Mobility
@@ -105,6 +106,26 @@ class GaussMarkov(Mobility):
     #: Default value of the direction mean.
     __DEFAULT_DIRECTION_MEAN = float(pi/0.6)
 
+    #: Names and expected types of the keyword parameters.
+    __KEYWORD_PARAMETERS = (('alpha', float), ('direction_deviation', float),
+                            ('direction_margin', float),
+                            ('direction_mean', float),
+                            ('recalculation_interval', int))
+
+    __slots__ = ('_GaussMarkov__area', '_GaussMarkov__time',
+                 '_GaussMarkov__alpha', '_GaussMarkov__direction_deviation',
+                 '_GaussMarkov__direction_margin',
+                 '_GaussMarkov__direction_mean',
+                 '_GaussMarkov__recalculation_interval',
+                 '_GaussMarkov__gauss_markov_factor_one',
+                 '_GaussMarkov__gauss_markov_factor_two',
+                 '_GaussMarkov__width_left', '_GaussMarkov__width_right',
+                 '_GaussMarkov__height_bottom', '_GaussMarkov__height_top',
+                 '_GaussMarkov__direction_mean_terms', '_GaussMarkov__width',
+                 '_GaussMarkov__height', '_GaussMarkov__simulation_period',
+                 '_GaussMarkov__two_pi', '_GaussMarkov__speeds',
+                 '_GaussMarkov__directions')
+
 
     def __init__(self, area, time, initial_coordinates, initial_speed,
                  **kwargs):
@@ -184,25 +205,22 @@ class GaussMarkov(Mobility):
         Mobility.__init__(self, GaussMarkov.__name__)
         self.__area = area
         self.__time = time
-        check_argument_type(GaussMarkov.__name__, 'initial_coordinates', list,
-                            initial_coordinates, self.logger)
-        check_argument_type(GaussMarkov.__name__, 'initial_speed', float,
-                            initial_speed, self.logger)
+        if __debug__:
+            check_argument_type(GaussMarkov.__name__, 'initial_coordinates',
+                                list, initial_coordinates, self.logger)
+            check_argument_type(GaussMarkov.__name__, 'initial_speed', float,
+                                initial_speed, self.logger)
+            for name, kind in GaussMarkov.__KEYWORD_PARAMETERS:
+                if name in kwargs:
+                    check_argument_type(GaussMarkov.__name__, name, kind,
+                                        kwargs[name], self.logger)
         if 'alpha' in kwargs:
-            check_argument_type(GaussMarkov.__name__, 'alpha', float,
-                                kwargs['alpha'], self.logger)
             if kwargs['alpha'] < 0.0 or kwargs['alpha'] > 1.0:
                 raise ValueError('Keyword parameter "alpha": a value of the' \
                                  ' "alpha" parameter cannot be less than' \
                                  ' zero and greater than one but %f given!' \
                                  % float(kwargs['alpha']))
-        if 'direction_deviation' in kwargs:
-            check_argument_type(GaussMarkov.__name__, 'direction_deviation',
-                                float, kwargs['direction_deviation'],
-                                self.logger)
         if 'direction_margin' in kwargs:
-            check_argument_type(GaussMarkov.__name__, 'direction_margin',
-                                float, kwargs['direction_margin'], self.logger)
             if kwargs['direction_margin'] < 0.0 \
                or kwargs['direction_margin'] > 1.0:
                 raise ValueError('Keyword parameter "direction_margin": a' \
@@ -210,13 +228,6 @@ class GaussMarkov(Mobility):
                                  ' less than zero and greater than one but' \
                                  ' %f given!' \
                                  % float(kwargs['direction_margin']))
-        if 'direction_mean' in kwargs:
-            check_argument_type(GaussMarkov.__name__, 'direction_mean', float,
-                                kwargs['direction_mean'], self.logger)
-        if 'recalculation_interval' in kwargs:
-            check_argument_type(GaussMarkov.__name__, 'recalculation_interval',
-                                int, kwargs['recalculation_interval'],
-                                self.logger)
         self.__alpha = float(kwargs.get('alpha', GaussMarkov.__DEFAULT_ALPHA))
         self.__direction_deviation = \
             float(kwargs.get('direction_deviation',
@@ -233,7 +244,8 @@ class GaussMarkov(Mobility):
         # 1.0 - alpha:
         self.__gauss_markov_factor_one = 1.0 - self.__alpha
         # sqrt((1.0 - alpha^2)):
-        self.__gauss_markov_factor_two = sqrt(1.0 - (pow(self.__alpha, 2.0)))
+        self.__gauss_markov_factor_two = \
+            sqrt(1.0 - (self.__alpha * self.__alpha))
         # area width * direction margin:
         self.__width_left = self.__area.width * self.__direction_margin
         # area width - (area width * direction margin):
@@ -242,27 +254,33 @@ class GaussMarkov(Mobility):
         self.__height_bottom = self.__area.height * self.__direction_margin
         # area height - (area height * direction margin):
         self.__height_top = self.__area.height - self.__height_bottom
-        # { node id:
-        #     { 'speed':      current speed),
-        #       'direction':  current direction } }
-        self.__velocities = dict()
-        for node_id in range(0, len(initial_coordinates)):
-            self.__velocities[node_id] = dict()
-            self.__velocities[node_id]['speed'] = float(initial_speed)
-            self.__velocities[node_id]['direction'] = \
-                self.__get_new_direction()
-        self.logger.debug('Speed and direction values has been initialized' \
-                          ' for %d nodes' % len(self.__velocities))
-
-    def __get_new_direction(self):
-        """
-        Randomizes a new direction with the normal (Gaussian) distribution.
-
-        *Returns*:
-            (`float`) a newly randomized direction value.
-        """
-        return fabs(self.random_generator.normal(self.__direction_mean,
-                                                 self.__direction_deviation))
+        # (1.0 - alpha) * direction mean, for nodes near the bottom border,
+        # away from the horizontal borders and near the top border (rows),
+        # and near the left border, away from the vertical borders and near
+        # the right border (columns):
+        self.__direction_mean_terms = \
+            tuple(tuple(self.__gauss_markov_factor_one * mean
+                        for mean in row)
+                  for row in ((pi/4.0, pi/2.0, (3.0/4.0)*pi),
+                              (0.0, self.__direction_mean, pi),
+                              ((7.0/4.0)*pi, (3.0/2.0)*pi, (5.0/4.0)*pi)))
+        # the area size and the simulation period do not change during the
+        # simulation, so they are read once for the position computations
+        self.__width = self.__area.width
+        self.__height = self.__area.height
+        self.__simulation_period = self.__time.simulation_period
+        # 2 * pi:
+        self.__two_pi = 2.0 * pi
+        # current speeds and directions of nodes (indexed by node ids)
+        self.__speeds = [float(initial_speed)] * len(initial_coordinates)
+        # initial directions are randomized with the normal (Gaussian)
+        # distribution, as in __velocity_recalculation()
+        normal = self.random_generator.normal
+        self.__directions = \
+            [fabs(normal(self.__direction_mean, self.__direction_deviation))
+             for _ in range(0, len(initial_coordinates))]
+        self.logger.debug('Speed and direction values has been initialized'
+                          ' for %d nodes', len(self.__speeds))
 
     def __velocity_recalculation(self, node_id, node_speed, node_coordinates):
         """
@@ -286,43 +304,33 @@ class GaussMarkov(Mobility):
         """
         # speed
         random_speed = node_speed.get_new()
-        self.__velocities[node_id]['speed'] = \
-            fabs((self.__alpha * self.__velocities[node_id]['speed'])
+        speed = \
+            fabs((self.__alpha * self.__speeds[node_id])
                  + (self.__gauss_markov_factor_one * node_speed.mean)
                  + (self.__gauss_markov_factor_two * random_speed))
-        # direction
+        self.__speeds[node_id] = speed
+        # direction (the top and left borders take precedence if the margins
+        # overlap)
         if node_coordinates[1] >= self.__height_top:
-            if node_coordinates[0] <= self.__width_left:
-                mean = (7.0/4.0)*pi
-            elif node_coordinates[0] >= self.__width_right:
-                mean = (5.0/4.0)*pi
-            else:
-                mean = (3.0/2.0)*pi
-        elif node_coordinates[1] <= self.__height_bottom:
-            if node_coordinates[0] <= self.__width_left:
-                mean = pi/4.0
-            elif node_coordinates[0] >= self.__width_right:
-                mean = (3.0/4.0)*pi
-            else:
-                mean = pi/2.0
-        elif node_coordinates[0] <= self.__width_left:
-            mean = 0.0
-        elif node_coordinates[0] >= self.__width_right:
-            mean = pi
+            row = 2
+        else:
+            row = int(node_coordinates[1] > self.__height_bottom)
+        if node_coordinates[0] <= self.__width_left:
+            column = 0
         else:
-            mean = self.__direction_mean
-        random_direction = self.__get_new_direction()
-        self.__velocities[node_id]['direction'] = \
-            (self.__alpha * self.__velocities[node_id]['direction']) \
-            + (self.__gauss_markov_factor_one * mean) \
+            column = 1 + (node_coordinates[0] >= self.__width_right)
+        # a random direction with the normal (Gaussian) distribution
+        random_direction = \
+            fabs(self.random_generator.normal(self.__direction_mean,
+                                              self.__direction_deviation))
+        direction = \
+            (self.__alpha * self.__directions[node_id]) \
+            + self.__direction_mean_terms[row][column] \
             + (self.__gauss_markov_factor_two * random_direction)
-        if self.logger.isEnabledFor('DEBUG'):
-            msg = 'A new velocity has been selected for the node #%d: the' \
-                  ' new speed is equal to %f and the new direction is equal' \
-                  ' to %f'
-            self.logger.debug(msg %
-                              (node_id, self.__velocities[node_id]['speed'],
-                               self.__velocities[node_id]['direction']))
+        self.__directions[node_id] = direction
+        self.logger.debug('A new velocity has been selected for the node #%d:'
+                          ' the new speed is equal to %f and the new direction'
+                          ' is equal to %f', node_id, speed, direction)
 
     def __step_move(self, node_id, node_coordinates):
         """
@@ -337,42 +345,46 @@ class GaussMarkov(Mobility):
             (`tuple`) current values of the node's horizontal and vertical
             coordinates.
         """
+        speed = self.__speeds[node_id]
+        direction = self.__directions[node_id]
+        period = self.__simulation_period
+        width = self.__width
+        height = self.__height
         horizontal_coordinate = \
-            node_coordinates[0] \
-            + (self.__velocities[node_id]['speed'] \
-               * cos(self.__velocities[node_id]['direction']))
-        horizontal_coordinate = \
-            node_coordinates[0] \
-            + ((horizontal_coordinate - node_coordinates[0]) \
-                * self.__time.simulation_period)
+            node_coordinates[0] + ((speed * cos(direction)) * period)
         if horizontal_coordinate < 0.0:
             horizontal_coordinate = 0.0
-            self.__velocities[node_id]['direction'] = \
-                (2.0*pi) - (2.0*self.__velocities[node_id]['direction'])
-        elif horizontal_coordinate > self.__area.width:
-            horizontal_coordinate = \
-                self.__area.width - (horizontal_coordinate - self.__area.width)
-            self.__velocities[node_id]['direction'] = \
-                (2.0*pi) - (2.0*self.__velocities[node_id]['direction'])
-        vertical_coordinate = \
-            node_coordinates[1] \
-            + (self.__velocities[node_id]['speed'] \
-               * sin(self.__velocities[node_id]['direction']))
+            direction = self.__two_pi - (2.0*direction)
+        elif horizontal_coordinate > width:
+            horizontal_coordinate = width - (horizontal_coordinate - width)
+            direction = self.__two_pi - (2.0*direction)
         vertical_coordinate = \
-            node_coordinates[1] \
-            + ((vertical_coordinate - node_coordinates[1]) \
-                * self.__time.simulation_period)
+            node_coordinates[1] + ((speed * sin(direction)) * period)
         if vertical_coordinate < 0.0:
             vertical_coordinate = 0.0
-            self.__velocities[node_id]['direction'] = \
-                (2.0*pi) - (2.0*self.__velocities[node_id]['direction'])
-        elif vertical_coordinate > self.__area.height:
-            vertical_coordinate = \
-                self.__area.height - (vertical_coordinate - self.__area.height)
-            self.__velocities[node_id]['direction'] = \
-                (2.0*pi) - (2.0*self.__velocities[node_id]['direction'])
+            direction = self.__two_pi - (2.0*direction)
+        elif vertical_coordinate > height:
+            vertical_coordinate = height - (vertical_coordinate - height)
+            direction = self.__two_pi - (2.0*direction)
+        self.__directions[node_id] = direction
         return (horizontal_coordinate, vertical_coordinate)
 
+    def __log_position(self, node_id, node_coordinates):
+        """
+        Logs a node's position, speed and direction at the current simulation
+        step.
+
+        *Parameters*:
+            - **node_id** (`int`): an identifier of the node;
+            - **node_coordinates** (`list`): values of the node's horizontal
+              and vertical coordinates at the current simulation step.
+        """
+        self.logger.debug('The current position of the node #%d is (%f, %f)'
+                          ' with the current speed equal to %f and direction'
+                          ' equal to %f', node_id, node_coordinates[0],
+                          node_coordinates[1],
+                          self.__speeds[node_id], self.__directions[node_id])
+
     def get_current_position(self, node_id, node_speed, node_coordinates):
         """
         Calculates and returns a node's position at the current simulation step
@@ -394,24 +406,53 @@ class GaussMarkov(Mobility):
             A tuple containing current values of the node's horizontal and
             vertical coordinates.
         """
-        if self.__time.simulation_step == 0:
-            if __debug__ and self.logger.isEnabledFor('DEBUG'):
-                msg = 'The current position of the node #%d is (%f, %f) with' \
-                      ' the current speed equal to %f and direction equal to' \
-                      ' %f'
-                self.logger.debug(msg %
-                    (node_id, node_coordinates[0], node_coordinates[1],
-                     self.__velocities[node_id]['speed'],
-                     self.__velocities[node_id]['direction']))
+        simulation_step = self.__time.simulation_step
+        if simulation_step == 0:
+            if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+                self.__log_position(node_id, node_coordinates)
             return node_coordinates
         coordinates = self.__step_move(node_id, node_coordinates)
-        if __debug__ and self.logger.isEnabledFor('DEBUG'):
-            msg = 'The current position of the node #%d is (%f, %f) with the' \
-                  ' current speed equal to %f and direction equal to %f'
-            self.logger.debug(msg % (node_id, coordinates[0], coordinates[1],
-                                     self.__velocities[node_id]['speed'],
-                                     self.__velocities[node_id]['direction']))
-        if self.__time.simulation_step % self.__recalculation_interval == 0:
-            self.__velocity_recalculation(node_id, node_speed, node_coordinates)
-        # print "%.30f    %.30f" % (coordinates[0], coordinates[1])
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+            self.__log_position(node_id, coordinates)
+        if simulation_step % self.__recalculation_interval == 0:
+            self.__velocity_recalculation(node_id, node_speed,
+                                          node_coordinates)
         return coordinates
+
+    def get_current_positions(self, nodes_speed, nodes_coordinates):
+        """
+        Calculates positions of all nodes at the current simulation step in
+        accordance with the Gauss-Markov mobility model, and stores them *in
+        place* in the given list of coordinates.  The positions are the same as
+        those returned by the :meth:`get_current_position` method called for
+        each node in ascending order of identifiers, but the checks that depend
+        only on the simulation step are performed once for all nodes.
+
+        *Parameters*:
+            - **nodes_speed** (`list`): objects representing speeds of all
+              nodes;
+            - **nodes_coordinates** (`list`): values of horizontal and
+              vertical coordinates of all nodes at the previous simulation
+              step; the values are replaced with the current coordinates.
+        """
+        simulation_step = self.__time.simulation_step
+        log = __debug__ and self.logger.isEnabledFor(logging.DEBUG)
+        if simulation_step == 0:
+            if log:
+                for node_id in range(0, len(nodes_coordinates)):
+                    self.__log_position(node_id, nodes_coordinates[node_id])
+            return
+        step_move = self.__step_move
+        if simulation_step % self.__recalculation_interval == 0:
+            velocity_recalculation = self.__velocity_recalculation
+        else:
+            velocity_recalculation = None
+        for node_id in range(0, len(nodes_coordinates)):
+            node_coordinates = nodes_coordinates[node_id]
+            coordinates = step_move(node_id, node_coordinates)
+            if log:
+                self.__log_position(node_id, coordinates)
+            if velocity_recalculation is not None:
+                velocity_recalculation(node_id, nodes_speed[node_id],
+                                       node_coordinates)
+            nodes_coordinates[node_id] = coordinates
@@ -28,6 +28,7 @@ simulation ends.
 """
 
 
+import logging
 from math import fabs
 
 from sim2net.mobility._mobility import Mobility
@@ -77,6 +78,14 @@ class NomadicCommunity(RandomWaypoint, Mobility):
     #: reference point change time.
     __DEFAULT_MAXIMUM_RELOCATION_PAUSE_TIME = 10.0
 
+    __slots__ = ('_NomadicCommunity__area_factor',
+                 '_NomadicCommunity__reference_point',
+                 '_NomadicCommunity__edges',
+                 '_NomadicCommunity__relocation_time',
+                 '_NomadicCommunity__next_relocation_check',
+                 '_NomadicCommunity__on_site',
+                 '_NomadicCommunity__on_site_number')
+
 
     def __init__(self, area, time, initial_coordinates, pause_time=0.0,
                  area_factor=0.25):
@@ -140,23 +149,24 @@ class NomadicCommunity(RandomWaypoint, Mobility):
                                            self._area.width),
              self.random_generator.uniform(self._area.ORIGIN[1],
                                            self._area.height))
+        # boundaries of the free roam area around the reference point
+        self.__edges = self.__get_free_roam_area_edges(self.__reference_point)
         self.__relocation_time = None
-        # { node id:
-        #     { 'destination':  (horizontal coordinate, vertical coordinate),
-        #       'pause time' :  time } }
-        #       'on site'    :  True/False } }
-        self._destinations = dict()
-        for node_id in range(0, len(initial_coordinates)):
-            self._destinations[node_id] = dict()
-            self._destinations[node_id]['destination'] = \
-                initial_coordinates[node_id]
-            self._destinations[node_id]['pause time'] = None
-            self._destinations[node_id]['on site'] = False
-        self.logger.debug('Destination points has been initialized for %d' \
-                          ' nodes with the initial reference point at (%f,' \
-                          ' %f)' % (len(self._destinations),
-                                    self.__reference_point[0],
-                                    self.__reference_point[1]))
+        # the simulation time from which the relocation of the reference point
+        # has to be checked again (see: __reference_point_relocation())
+        self.__next_relocation_check = float('-inf')
+        # destination points and current pause times (or None values if
+        # nodes are not paused) of nodes, and whether nodes have reached the
+        # current area of free roam, indexed by node ids
+        self._destinations = list(initial_coordinates)
+        self._pause_times = [None] * len(initial_coordinates)
+        self.__on_site = [False] * len(initial_coordinates)
+        # the number of nodes that have reached the current area of free roam
+        self.__on_site_number = 0
+        self.logger.debug('Destination points has been initialized for %d'
+                          ' nodes with the initial reference point at (%f,'
+                          ' %f)', len(self._destinations),
+                          self.__reference_point[0], self.__reference_point[1])
 
     def __get_free_roam_area_edges(self, reference_point):
         """
@@ -170,42 +180,75 @@ class NomadicCommunity(RandomWaypoint, Mobility):
             A `tuple` containing values of the top, right, bottom and left
             boundaries (respectively) in the simulation area.
         """
-        offset = 0.5 * self._area.width * self.__area_factor
-        left_edge = reference_point[0] - offset
+        width = self._area.width
+        height = self._area.height
+        horizontal_coordinate, vertical_coordinate = reference_point
+        offset = 0.5 * width * self.__area_factor
+        left_edge = horizontal_coordinate - offset
         if left_edge < 0.0:
             left_edge = 0.0
-        right_edge = reference_point[0] + offset
-        if right_edge > self._area.width:
-            right_edge = self._area.width
-        offset = 0.5 * self._area.height * self.__area_factor
-        bottom_edge = reference_point[1] - offset
+        right_edge = horizontal_coordinate + offset
+        if right_edge > width:
+            right_edge = width
+        offset = 0.5 * height * self.__area_factor
+        bottom_edge = vertical_coordinate - offset
         if bottom_edge < 0.0:
             bottom_edge = 0.0
-        top_edge = reference_point[1] + offset
-        if top_edge > self._area.height:
-            top_edge = self._area.height
+        top_edge = vertical_coordinate + offset
+        if top_edge > height:
+            top_edge = height
         return (top_edge, right_edge, bottom_edge, left_edge)
 
     def __get_new_reference_point(self):
         """
-        Uniformly randomizes new coordinates of the reference point.  The
+        Uniformly randomizes new coordinates of the reference point, such that
+        the new area of free roam does not overlap the current one.  The
         vertical and horizontal coordinates are returned (respectively) as a
         `tuple`.
+
+        The new free roam area does not overlap the current one if and only if
+        the new reference point lies outside the current area extended by half
+        of the free roam area width and height.  The rest of the simulation
+        area is divided into (at most) four disjoint rectangles, one of which
+        is randomly picked with probability proportional to its area, and the
+        reference point is uniformly randomized within the rectangle.  If there
+        is no such point, the reference point is uniformly randomized within
+        the whole simulation area.
         """
-        edges = self.__get_free_roam_area_edges(self.__reference_point)
-        while True:
-            reference_point = \
-                (self.random_generator.uniform(self._area.ORIGIN[0],
-                                               self._area.width),
-                 self.random_generator.uniform(self._area.ORIGIN[1],
-                                               self._area.height))
-            new_edges = self.__get_free_roam_area_edges(reference_point)
-            if new_edges[2] > edges[0] or new_edges[3] > edges[1] \
-               or new_edges[0] < edges[2] or new_edges[1] < edges[3]:
-                break
-        self.logger.debug('New coordinates of the reference point has been' \
-                          ' selected: (%f, %f)' % (reference_point[0],
-                                                   reference_point[1]))
+        width = self._area.width
+        height = self._area.height
+        top, right, bottom, left = self.__edges
+        offset = 0.5 * width * self.__area_factor
+        left = max(left - offset, 0.0)
+        right = min(right + offset, width)
+        offset = 0.5 * height * self.__area_factor
+        bottom = max(bottom - offset, 0.0)
+        top = min(top + offset, height)
+        # (left, right, bottom, top) edges of the rectangles
+        rectangles = ((0.0, left, 0.0, height), (right, width, 0.0, height),
+                      (left, right, 0.0, bottom), (left, right, top, height))
+        areas = [(rectangle[1] - rectangle[0]) * (rectangle[3] - rectangle[2])
+                 for rectangle in rectangles]
+        uniform = self.random_generator.uniform
+        total_area = sum(areas)
+        if total_area > 0.0:
+            position = uniform(0.0, total_area)
+            for rectangle, area in zip(rectangles, areas):
+                if area > 0.0:
+                    chosen = rectangle
+                    if position < area:
+                        break
+                    position -= area
+        else:
+            self.logger.debug('The free roam area is too large to be'
+                              ' relocated without overlapping')
+            chosen = (self._area.ORIGIN[0], width,
+                      self._area.ORIGIN[1], height)
+        reference_point = (uniform(chosen[0], chosen[1]),
+                           uniform(chosen[2], chosen[3]))
+        self.logger.debug('New coordinates of the reference point has been'
+                          ' selected: (%f, %f)', reference_point[0],
+                          reference_point[1])
         return reference_point
 
     def __get_new_relocation_time(self):
@@ -221,9 +264,9 @@ class NomadicCommunity(RandomWaypoint, Mobility):
                    NomadicCommunity.__DEFAULT_MINIMUM_RELOCATION_PAUSE_TIME,
                    NomadicCommunity.__DEFAULT_MAXIMUM_RELOCATION_PAUSE_TIME) \
                * self._pause_time)
-        self.logger.debug('New reference point relocation time has been' \
-                          ' selected: %f simulation time units'
-                          % relocation_time)
+        self.logger.debug('New reference point relocation time has been'
+                          ' selected: %f simulation time units',
+                          relocation_time)
         return relocation_time
 
     def __reference_point_relocation(self):
@@ -234,53 +277,54 @@ class NomadicCommunity(RandomWaypoint, Mobility):
         coordinates of the reference point are preserved.
         """
         if self.__relocation_time is None:
-            for node_id in self._destinations:
-                if not self._destinations[node_id]['on site']:
-                    return
+            if self.__on_site_number < len(self.__on_site):
+                # checked again once all nodes are on site
+                self.__next_relocation_check = float('inf')
+                return
             self.__relocation_time = \
                 self._time.simulation_time + self.__get_new_relocation_time()
+            self.__next_relocation_check = self.__relocation_time
         else:
             if self.__relocation_time <= self._time.simulation_time:
                 self.__relocation_time = None
-                for node_id in self._destinations:
-                    self._destinations[node_id]['on site'] = False
+                self.__on_site = [False] * len(self.__on_site)
+                self.__on_site_number = 0
                 self.__reference_point = self.__get_new_reference_point()
+                self.__edges = \
+                    self.__get_free_roam_area_edges(self.__reference_point)
+                self.__next_relocation_check = float('inf')
 
     def _get_new_destination(self):
         """
         Uniformly randomizes a new waypoint within the range of free roam and
         returns its coordinates as a `tuple`.
         """
-        edges = self.__get_free_roam_area_edges(self.__reference_point)
-        return (self.random_generator.uniform(edges[3], edges[1]),
-                self.random_generator.uniform(edges[2], edges[0]))
+        edges = self.__edges
+        uniform = self.random_generator.uniform
+        return (uniform(edges[3], edges[1]), uniform(edges[2], edges[0]))
 
-    def get_current_position(self, node_id, node_speed, node_coordinates):
+    def _current_position(self, node_id, node_speed, node_coordinates, log):
         """
-        Calculates and returns a node's position at the current simulation step
-        in accordance with the Nomadic Community mobility model (and Random
-        Waypoint model within the area of free roam).
-
-        A distance of the route traveled by the node, between the current and
-        previous simulation steps, is calculated as the product of the current
-        node's speed and the *simulation period* (see: :mod:`sim2net._time`
-        module).  Therefore, it is assumed that this method is called at every
-        simulation step.
+        Calculates and returns a node's position at the current simulation
+        step.  (See: :meth:`get_current_position`.)
 
         *Parameters*:
             - **node_id** (`int`): an identifier of the node;
             - **node_speed**: an object representing the node's speed;
             - **node_coordinates** (`list`): values of the node's horizontal
-              and vertical coordinates at the previous simulation step.
+              and vertical coordinates at the previous simulation step;
+            - **log** (`bool`): whether the current position of the node
+              should be logged.
 
         *Returns*:
             A tuple containing current values of the node's horizontal and
             vertical coordinates.
         """
         # reference point relocation?
-        self.__reference_point_relocation()
+        if self._time.simulation_time >= self.__next_relocation_check:
+            self.__reference_point_relocation()
         # pause time?
-        if self._destinations[node_id]['pause time'] is not None:
+        if self._pause_times[node_id] is not None:
             if self._pause(node_id, node_coordinates) is None:
                 self._assign_new_destination(node_id, node_speed)
             return node_coordinates
@@ -290,23 +334,52 @@ class NomadicCommunity(RandomWaypoint, Mobility):
                and 0 <= coordinates[1] <= self._area.height, \
                'The new coordinates (%f, %f) exceed dimensions of the' \
                ' simulation area!' % coordinates
-        if (coordinates[0] == self._destinations[node_id]['destination'][0]
-            and
-            coordinates[1] == self._destinations[node_id]['destination'][1]):
-            if not self._destinations[node_id]['on site']:
-                edges = self.__get_free_roam_area_edges(self.__reference_point)
+        destination = self._destinations[node_id]
+        if coordinates[0] == destination[0] \
+           and coordinates[1] == destination[1]:
+            if not self.__on_site[node_id]:
+                edges = self.__edges
                 if coordinates[0] >= edges[3] \
                    and coordinates[0] <= edges[1] \
                    and coordinates[1] >= edges[2] \
                    and coordinates[1] <= edges[0]:
-                    self._destinations[node_id]['on site'] = True
+                    self.__on_site[node_id] = True
+                    self.__on_site_number += 1
+                    if self.__on_site_number == len(self.__on_site):
+                        self.__next_relocation_check = float('-inf')
             if self._assign_new_pause_time(node_id) is not None:
-                self._destinations[node_id]['destination'] = [None, None]
+                self._destinations[node_id] = [None, None]
             else:
                 self._assign_new_destination(node_id, node_speed)
-        elif __debug__ and self.logger.isEnabledFor('DEBUG'):
+        elif log:
             msg = 'The current position of the node #%d is (%f, %f) with the' \
                   ' current speed equal to %f'
-            self.logger.debug(msg % (node_id, coordinates[0], coordinates[1],
-                                     fabs(node_speed.current)))
+            self.logger.debug(msg, node_id, coordinates[0], coordinates[1],
+                              fabs(node_speed.current))
         return coordinates
+
+    def get_current_position(self, node_id, node_speed, node_coordinates):
+        """
+        Calculates and returns a node's position at the current simulation step
+        in accordance with the Nomadic Community mobility model (and Random
+        Waypoint model within the area of free roam).
+
+        A distance of the route traveled by the node, between the current and
+        previous simulation steps, is calculated as the product of the current
+        node's speed and the *simulation period* (see: :mod:`sim2net._time`
+        module).  Therefore, it is assumed that this method is called at every
+        simulation step.
+
+        *Parameters*:
+            - **node_id** (`int`): an identifier of the node;
+            - **node_speed**: an object representing the node's speed;
+            - **node_coordinates** (`list`): values of the node's horizontal
+              and vertical coordinates at the previous simulation step.
+
+        *Returns*:
+            A tuple containing current values of the node's horizontal and
+            vertical coordinates.
+        """
+        return self._current_position(
+            node_id, node_speed, node_coordinates,
+            __debug__ and self.logger.isEnabledFor(logging.DEBUG))
@@ -65,6 +65,8 @@ class RandomDirection(RandomWaypoint, Mobility):
     .. seealso::  :mod:`sim2net.mobility.random_waypoint`
     """
 
+    __slots__ = ()
+
     def __init__(self, area, time, initial_coordinates, pause_time=0.0):
         """
         *Parameters*:
@@ -99,7 +101,6 @@ class RandomDirection(RandomWaypoint, Mobility):
         Mobility.__init__(self, RandomDirection.__name__)
         self._area = area
         self._time = time
-        self._destinations = dict()
         check_argument_type(RandomDirection.__name__, 'initial_coordinates',
                             list, initial_coordinates, self.logger)
         check_argument_type(RandomDirection.__name__, 'pause_time', float,
@@ -109,27 +110,22 @@ class RandomDirection(RandomWaypoint, Mobility):
                              ' time cannot be less that zero but %f given!' \
                              % float(pause_time))
         self._pause_time = float(pause_time)
-        # { node id:
-        #     { 'destination':  (horizontal coordinate, vertical coordinate),
-        #       'pause time' :  time } }
-        for node_id in range(0, len(initial_coordinates)):
-            self._destinations[node_id] = dict()
-            self._destinations[node_id]['destination'] = \
-                initial_coordinates[node_id]
-            self._destinations[node_id]['pause time'] = None
-        self.logger.debug('Destination points has been initialized for %d' \
-                          ' nodes' % len(self._destinations))
+        # destination points and current pause times (or None values if
+        # nodes are not paused) of nodes, indexed by node ids
+        self._destinations = list(initial_coordinates)
+        self._pause_times = [None] * len(initial_coordinates)
+        self.logger.debug('Destination points has been initialized for %d'
+                          ' nodes', len(self._destinations))
 
     def _get_new_destination(self):
         """
         Randomizes a new destination point on the boundary of the simulation
         area and returns its coordinates as a `tuple`.
         """
-        destinations = (self.random_generator.uniform(self._area.ORIGIN[0],
-                                                      self._area.width),
-                        self.random_generator.uniform(self._area.ORIGIN[1],
-                                                      self._area.height))
-        direction = self.random_generator.uniform(0.0, 4.0)
+        uniform = self.random_generator.uniform
+        destinations = (uniform(self._area.ORIGIN[0], self._area.width),
+                        uniform(self._area.ORIGIN[1], self._area.height))
+        direction = uniform(0.0, 4.0)
         if direction > 3.0:
             return (0.0, destinations[1])
         elif direction > 2.0:
@@ -38,7 +38,8 @@ independently of other nodes.
 """
 
 
-from math import fabs, sqrt
+import logging
+from math import fabs, hypot
 
 from sim2net.mobility._mobility import Mobility
 from sim2net.utility.validation import check_argument_type
@@ -64,6 +65,9 @@ class RandomWaypoint(Mobility):
         presumed that the method is called at each step of the simulation.
     """
 
+    __slots__ = ('_area', '_time', '_pause_time', '_destinations',
+                 '_pause_times')
+
     def __init__(self, area, time, initial_coordinates, pause_time=0.0):
         """
         *Parameters*:
@@ -98,7 +102,6 @@ class RandomWaypoint(Mobility):
         super(RandomWaypoint, self).__init__(RandomWaypoint.__name__)
         self._area = area
         self._time = time
-        self._destinations = dict()
         check_argument_type(RandomWaypoint.__name__, 'initial_coordinates',
                             list, initial_coordinates, self.logger)
         check_argument_type(RandomWaypoint.__name__, 'pause_time', float,
@@ -108,25 +111,20 @@ class RandomWaypoint(Mobility):
                              ' time cannot be less that zero but %f given!' \
                              % float(pause_time))
         self._pause_time = float(pause_time)
-        # { node id:
-        #     { 'destination':  (horizontal coordinate, vertical coordinate),
-        #       'pause time' :  time } }
-        for node_id in range(0, len(initial_coordinates)):
-            self._destinations[node_id] = dict()
-            self._destinations[node_id]['destination'] = \
-                initial_coordinates[node_id]
-            self._destinations[node_id]['pause time'] = None
-        self.logger.debug('Destination points has been initialized for %d' \
-                          ' nodes' % len(self._destinations))
+        # destination points and current pause times (or None values if
+        # nodes are not paused) of nodes, indexed by node ids
+        self._destinations = list(initial_coordinates)
+        self._pause_times = [None] * len(initial_coordinates)
+        self.logger.debug('Destination points has been initialized for %d'
+                          ' nodes', len(self._destinations))
 
     def _get_new_destination(self):
         """
         Randomizes a new waypoint and returns its coordinates as a `tuple`.
         """
-        return (self.random_generator.uniform(self._area.ORIGIN[0],
-                                              self._area.width),
-                self.random_generator.uniform(self._area.ORIGIN[1],
-                                              self._area.height))
+        uniform = self.random_generator.uniform
+        return (uniform(self._area.ORIGIN[0], self._area.width),
+                uniform(self._area.ORIGIN[1], self._area.height))
 
     def _get_new_pause_time(self):
         """
@@ -143,16 +141,14 @@ class RandomWaypoint(Mobility):
             - **node_id** (`int`): an identifier of the node;
             - **node_speed**: an object representing the node's speed.
         """
-        self._destinations[node_id]['destination'] = \
-            self._get_new_destination()
+        destination = self._get_new_destination()
+        self._destinations[node_id] = destination
         node_speed.get_new()
-        if self.logger.isEnabledFor('DEBUG'):
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
             msg = 'A new destination has been selected for the node #%d:' \
                   ' (%f, %f) with the current speed equal to %f'
-            self.logger.debug(
-                msg % (node_id, self._destinations[node_id]['destination'][0],
-                       self._destinations[node_id]['destination'][1],
-                       fabs(node_speed.current)))
+            self.logger.debug(msg, node_id, destination[0], destination[1],
+                              fabs(node_speed.current))
 
     def _assign_new_pause_time(self, node_id):
         """
@@ -168,17 +164,17 @@ class RandomWaypoint(Mobility):
         """
         if self._pause_time > 0:
             pause_time = self._get_new_pause_time()
-            self._destinations[node_id]['pause time'] = pause_time
+            self._pause_times[node_id] = pause_time
         else:
             pause_time = 0.0
-            self._destinations[node_id]['pause time'] = None
-        if self.logger.isEnabledFor('DEBUG'):
+            self._pause_times[node_id] = None
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+            destination = self._destinations[node_id]
             msg = 'The node #%d is now in its destination position (%f, %f)' \
                   ' with the pause time equal to %f'
-            self.logger.debug(msg %
-                (node_id, self._destinations[node_id]['destination'][0],
-                self._destinations[node_id]['destination'][1], pause_time))
-        return self._destinations[node_id]['pause time']
+            self.logger.debug(msg, node_id, destination[0], destination[1],
+                              pause_time)
+        return self._pause_times[node_id]
 
     def _parallel_trajectory(self, coordinate, destination, step_distance):
         """
@@ -207,16 +203,18 @@ class RandomWaypoint(Mobility):
             return coordinate - step_distance
         return destination
 
-    def _diagonal_trajectory(self, node_id, node_coordinates, step_distance):
+    def _diagonal_trajectory(self, node_coordinates, destination,
+                             step_distance):
         """
         Computes the current position of a node if its trajectory is not
         parallel to the horizontal or vertical axis of the simulation area.
         (See also: :meth:`_parallel_trajectory`.)
 
         *Parameters*:
-            - **node_id** (`int`): an identifier of the node;
             - **node_coordinates** (`list`): values of the node's horizontal
-              and vertical coordinates at the previous simulation step.
+              and vertical coordinates at the previous simulation step;
+            - **destination** (`tuple`): values of the horizontal and vertical
+              coordinates of the node's destination point;
             - **step_distance** (`float`): a distance that the node has moved
               between the previous and current simulation step.
 
@@ -224,34 +222,32 @@ class RandomWaypoint(Mobility):
             (`tuple`) current values of the node's horizontal and vertical
             coordinates.
         """
-        horizontal_destination = self._destinations[node_id]['destination'][0]
-        vertical_destination = self._destinations[node_id]['destination'][1]
+        horizontal_coordinate, vertical_coordinate = node_coordinates
+        horizontal_destination, vertical_destination = destination
         horizontal_distance = \
-            fabs(horizontal_destination - node_coordinates[0])
-        vertical_distance = fabs(vertical_destination - node_coordinates[1])
-        distance = \
-            sqrt(pow(horizontal_distance, 2.0) + pow(vertical_distance, 2.0))
+            fabs(horizontal_destination - horizontal_coordinate)
+        vertical_distance = fabs(vertical_destination - vertical_coordinate)
+        distance = hypot(horizontal_distance, vertical_distance)
         if step_distance >= distance:
             return (horizontal_destination, vertical_destination)
-        horizontal_coordinate = \
-            (horizontal_distance * step_distance) / distance
-        vertical_coordinate = \
-            (vertical_distance * horizontal_coordinate) / horizontal_distance
-        if node_coordinates[0] < horizontal_destination:
-            horizontal_coordinate = node_coordinates[0] + horizontal_coordinate
+        horizontal_step = (horizontal_distance * step_distance) / distance
+        vertical_step = \
+            (vertical_distance * horizontal_step) / horizontal_distance
+        if horizontal_coordinate < horizontal_destination:
+            horizontal_coordinate += horizontal_step
         else:
-            horizontal_coordinate = node_coordinates[0] - horizontal_coordinate
-        if node_coordinates[1] < vertical_destination:
-            vertical_coordinate = node_coordinates[1] + vertical_coordinate
+            horizontal_coordinate -= horizontal_step
+        if vertical_coordinate < vertical_destination:
+            vertical_coordinate += vertical_step
         else:
-            vertical_coordinate = node_coordinates[1] - vertical_coordinate
+            vertical_coordinate -= vertical_step
         return (horizontal_coordinate, vertical_coordinate)
 
     def _step_move(self, node_id, node_speed, node_coordinates):
         """
         Computes a node's position at the current simulation step. If its
         trajectory is parallel to the horizontal or vertical axis of the
-        simulation area, the :meth:`_steady_trajectory` method is used,
+        simulation area, the :meth:`_parallel_trajectory` method is used,
         otherwise the :meth:`_diagonal_trajectory` method is used.
 
         *Parameters*:
@@ -264,24 +260,25 @@ class RandomWaypoint(Mobility):
             (`tuple`) current values of the node's horizontal and vertical
             coordinates.
         """
-        horizontal_destination = self._destinations[node_id]['destination'][0]
-        vertical_destination = self._destinations[node_id]['destination'][1]
-        if node_coordinates[0] == horizontal_destination \
-           and node_coordinates[1] == vertical_destination:
+        destination = self._destinations[node_id]
+        horizontal_destination, vertical_destination = destination
+        horizontal_coordinate, vertical_coordinate = node_coordinates
+        if horizontal_coordinate == horizontal_destination \
+           and vertical_coordinate == vertical_destination:
             return (horizontal_destination, vertical_destination)
         step_distance = fabs(node_speed.current) * self._time.simulation_period
-        if node_coordinates[0] == horizontal_destination:
+        if horizontal_coordinate == horizontal_destination:
             return \
                 (horizontal_destination,
                  self._parallel_trajectory(
-                     node_coordinates[1], vertical_destination, step_distance))
-        if node_coordinates[1] == vertical_destination:
+                     vertical_coordinate, vertical_destination, step_distance))
+        if vertical_coordinate == vertical_destination:
             return \
                 (self._parallel_trajectory(
-                     node_coordinates[0], horizontal_destination,
+                     horizontal_coordinate, horizontal_destination,
                      step_distance),
                  vertical_destination)
-        return self._diagonal_trajectory(node_id, node_coordinates,
+        return self._diagonal_trajectory(node_coordinates, destination,
                                          step_distance)
 
     def _pause(self, node_id, node_coordinates):
@@ -294,42 +291,37 @@ class RandomWaypoint(Mobility):
             - **node_coordinates** (`list`): values of the node's horizontal
               and vertical coordinates at the previous simulation step.
         """
-        self._destinations[node_id]['pause time'] -= \
-            self._time.simulation_period
-        if self._destinations[node_id]['pause time'] <= 0:
-            self._destinations[node_id]['pause time'] = None
+        pause_time = self._pause_times[node_id] - self._time.simulation_period
+        if pause_time <= 0:
+            pause_time = None
         else:
-            if __debug__ and self.logger.isEnabledFor('DEBUG'):
+            if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
                 msg = 'The node #%d is still in its destination position' \
                       ' (%f, %f) with the pause time equal to %f'
-                self.logger.debug(msg %
-                    (node_id, node_coordinates[0], node_coordinates[1],
-                     self._destinations[node_id]['pause time']))
-        return self._destinations[node_id]['pause time']
+                self.logger.debug(msg, node_id, node_coordinates[0],
+                                  node_coordinates[1], pause_time)
+        self._pause_times[node_id] = pause_time
+        return pause_time
 
-    def get_current_position(self, node_id, node_speed, node_coordinates):
+    def _current_position(self, node_id, node_speed, node_coordinates, log):
         """
-        Calculates and returns a node's position at the current simulation step
-        in accordance with the Random Waypoint mobility model.
-
-        A distance of the route traveled by the node, between the current and
-        previous simulation steps, is calculated as the product of the current
-        node's speed and the *simulation period* (see: :mod:`sim2net._time`
-        module).  Therefore, it is assumed that this method is called at every
-        simulation step.
+        Calculates and returns a node's position at the current simulation
+        step.  (See: :meth:`get_current_position`.)
 
         *Parameters*:
             - **node_id** (`int`): an identifier of the node;
             - **node_speed**: an object representing the node's speed;
             - **node_coordinates** (`list`): values of the node's horizontal
-              and vertical coordinates at the previous simulation step.
+              and vertical coordinates at the previous simulation step;
+            - **log** (`bool`): whether the current position of the node
+              should be logged.
 
         *Returns*:
             A tuple containing current values of the node's horizontal and
             vertical coordinates.
         """
         # pause time?
-        if self._destinations[node_id]['pause time'] is not None:
+        if self._pause_times[node_id] is not None:
             if self._pause(node_id, node_coordinates) is None:
                 self._assign_new_destination(node_id, node_speed)
             return node_coordinates
@@ -339,18 +331,64 @@ class RandomWaypoint(Mobility):
                and 0 <= coordinates[1] <= self._area.height, \
                'The new coordinates (%f, %f) exceed dimensions of the' \
                ' simulation area!' % coordinates
-        if (coordinates[0] == self._destinations[node_id]['destination'][0]
-            and
-            coordinates[1] == self._destinations[node_id]['destination'][1]):
-            # print "%.30f    %.30f" % (coordinates[0], coordinates[1])
+        destination = self._destinations[node_id]
+        if coordinates[0] == destination[0] \
+           and coordinates[1] == destination[1]:
             if self._assign_new_pause_time(node_id) is not None:
-                self._destinations[node_id]['destination'] = [None, None]
+                self._destinations[node_id] = [None, None]
             else:
                 self._assign_new_destination(node_id, node_speed)
-        elif __debug__ and self.logger.isEnabledFor('DEBUG'):
+        elif log:
             msg = 'The current position of the node #%d is (%f, %f) with the' \
                   ' current speed equal to %f'
-            self.logger.debug(msg % (node_id, coordinates[0], coordinates[1],
-                                     fabs(node_speed.current)))
-        # print "%.30f    %.30f" % (coordinates[0], coordinates[1])
+            self.logger.debug(msg, node_id, coordinates[0], coordinates[1],
+                              fabs(node_speed.current))
         return coordinates
+
+    def get_current_position(self, node_id, node_speed, node_coordinates):
+        """
+        Calculates and returns a node's position at the current simulation step
+        in accordance with the Random Waypoint mobility model.
+
+        A distance of the route traveled by the node, between the current and
+        previous simulation steps, is calculated as the product of the current
+        node's speed and the *simulation period* (see: :mod:`sim2net._time`
+        module).  Therefore, it is assumed that this method is called at every
+        simulation step.
+
+        *Parameters*:
+            - **node_id** (`int`): an identifier of the node;
+            - **node_speed**: an object representing the node's speed;
+            - **node_coordinates** (`list`): values of the node's horizontal
+              and vertical coordinates at the previous simulation step.
+
+        *Returns*:
+            A tuple containing current values of the node's horizontal and
+            vertical coordinates.
+        """
+        return self._current_position(
+            node_id, node_speed, node_coordinates,
+            __debug__ and self.logger.isEnabledFor(logging.DEBUG))
+
+    def get_current_positions(self, nodes_speed, nodes_coordinates):
+        """
+        Calculates positions of all nodes at the current simulation step in
+        accordance with the mobility model, and stores them *in place* in the
+        given list of coordinates.  The positions are the same as those
+        returned by the :meth:`get_current_position` method called for each
+        node in ascending order of identifiers, but the logging level is
+        checked once for all nodes.
+
+        *Parameters*:
+            - **nodes_speed** (`list`): objects representing speeds of all
+              nodes;
+            - **nodes_coordinates** (`list`): values of horizontal and
+              vertical coordinates of all nodes at the previous simulation
+              step; the values are replaced with the current coordinates.
+        """
+        current_position = self._current_position
+        log = __debug__ and self.logger.isEnabledFor(logging.DEBUG)
+        for node_id in range(0, len(nodes_coordinates)):
+            nodes_coordinates[node_id] = \
+                current_position(node_id, nodes_speed[node_id],
+                                 nodes_coordinates[node_id], log)
@@ -85,3 +85,22 @@ class PacketLoss(object):
         raise NotImplementedError('The abstract class "PacketLoss" has' \
                                   ' no implementation of the' \
                                   ' "packet_loss()" method!')
+
+    def packet_losses(self, packets_number):
+        """
+        Returns information about whether each of the given number of
+        transmitted packets has been lost or can be successfully received by
+        destination nodes according to the implemented packet loss model.
+
+        The default implementation calls the :meth:`packet_loss` method
+        *packets_number* times, so model classes may override it with a more
+        efficient one.
+
+        *Parameters*:
+            - **packets_number** (`int`): the number of transmitted packets.
+
+        *Returns*:
+            A `list` of `bool` values; `True` value in position :math:`i`
+            indicates that packet number :math:`i` has been lost.
+        """
+        return [self.packet_loss() for packet in range(packets_number)]
@@ -155,3 +155,31 @@ class GilbertElliott(PacketLoss):
         if loss <= self.__current_state[2]:
             return True
         return False
+
+    def packet_losses(self, packets_number):
+        """
+        Returns information about whether each of the given number of
+        transmitted packets has been lost or can be successfully received by
+        destination node(s) according to the Gilbert-Elliott packet loss
+        model.  The result is the same as for *packets_number* consecutive
+        calls to the :meth:`packet_loss` method.
+
+        *Parameters*:
+            - **packets_number** (`int`): the number of transmitted packets.
+
+        *Returns*:
+            A `list` of `bool` values; `True` value in position :math:`i`
+            indicates that packet number :math:`i` has been lost.
+        """
+        uniform = self.random_generator.uniform
+        current_state = self.__current_state
+        losses = list()
+        for packet in range(packets_number):
+            if uniform(0.0, 1.0) <= current_state[1]:
+                if current_state[0] == 'G':
+                    current_state = self.__state_b
+                else:
+                    current_state = self.__state_g
+            losses.append(uniform(0.0, 1.0) <= current_state[2])
+        self.__current_state = current_state
+        return losses
@@ -204,8 +204,7 @@ class Grid(Placement):
             self.__get_vertical_coordinates(columns, rows, distance)
         self.logger.debug('Initial placement coordinates has been'
                           ' generated: %d nodes within %dx%d %s simulation'
-                          ' area' %
-                          (self.__nodes_number, self.__area.width,
-                           self.__area.height,
-                           self.__area.__class__.__name__.lower()))
+                          ' area', self.__nodes_number, self.__area.width,
+                          self.__area.height,
+                          self.__area.__class__.__name__.lower())
         return zip(horizontal_coordinates, vertical_coordinates)
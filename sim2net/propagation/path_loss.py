@@ -24,7 +24,7 @@ usable level, and hence, the nodes are able to communicate directly.
 """
 
 
-from math import pow, sqrt
+from math import sqrt
 
 from sim2net.propagation._propagation import Propagation
 from sim2net.utility.validation import check_argument_type
@@ -38,8 +38,17 @@ class PathLoss(Propagation):
     This class implements simplified path loss model in which the
     signal-to-noise ration is calculated on the given value of the transmission
     range of nodes.
+
+    Neighboring nodes are found with the use of a uniform grid of square cells
+    with sides equal to the transmission range, so only nodes placed in the
+    same or adjacent cells are compared with each other.
     """
 
+    #: Offsets of cells that are compared with each cell of the grid; the
+    #: remaining adjacent cells are covered by the symmetry of the neighborhood
+    #: relation.
+    __ADJACENT_CELLS = ((0, 0), (1, 0), (1, 1), (0, 1), (-1, 1))
+
     def __init__(self, transmission_range):
         """
         *Parameters*:
@@ -61,27 +70,6 @@ class PathLoss(Propagation):
                              ' 0 but %f given!' % float(transmission_range))
         self.__transmission_range = float(transmission_range)
 
-    def __distance(self, source_coordinates, destination_coordinates):
-        """
-        Calculates the distance between source and destination nodes in
-        Cartesian space.
-
-        *Parameters*:
-            - **source_coordinates** (`list`): values of the source node's
-              horizontal and vertical coordinates at the current simulation
-              step;
-            - **destination_coordinates** (`list`): values of the destination
-              node's horizontal and vertical coordinates at the current
-              simulation step.
-
-        *Returns*:
-            The distance between source and destination nodes in Cartesian
-            space of type `float`.
-        """
-        return \
-            sqrt(pow(source_coordinates[0] - destination_coordinates[0], 2) \
-                 + pow(source_coordinates[1] - destination_coordinates[1], 2))
-
     def get_neighbors(self, coordinates):
         """
         Calculates identifiers of all nodes in a network that would be able to
@@ -114,17 +102,45 @@ class PathLoss(Propagation):
             >>> print pathloss.get_neighbors(coordinates)
             [[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]]
         """
-        neighbors = list()
+        transmission_range = self.__transmission_range
+        # uniform grid of square cells with sides equal to the transmission
+        # range, so that neighboring nodes are placed in adjacent cells only
+        cells = dict()
         for node in range(0, len(coordinates)):
-            neighbors.append(list())
-        for source_node in range(0, len(coordinates)):
-            for destination_node in range(source_node + 1, len(coordinates)):
-                if self.__distance(coordinates[source_node],
-                                   coordinates[destination_node]) \
-                   <= self.__transmission_range:
-                    neighbors[source_node].append(destination_node)
-                    neighbors[destination_node].append(source_node)
-        if __debug__ and self.logger.isEnabledFor('DEBUG'):
-            self.logger.debug('Neighboring nodes has been computed for %d' \
-                              ' nodes' % len(coordinates))
+            cell = (int(coordinates[node][0] // transmission_range),
+                    int(coordinates[node][1] // transmission_range))
+            if cell in cells:
+                cells[cell].append(node)
+            else:
+                cells[cell] = [node]
+        neighbors = [list() for node in range(0, len(coordinates))]
+        for (column, row), source_nodes in cells.items():
+            for horizontal_offset, vertical_offset \
+                    in PathLoss.__ADJACENT_CELLS:
+                destination_nodes = \
+                    cells.get((column + horizontal_offset,
+                               row + vertical_offset))
+                if destination_nodes is None:
+                    continue
+                same_cell = destination_nodes is source_nodes
+                for source_node in source_nodes:
+                    source_coordinates = coordinates[source_node]
+                    for destination_node in destination_nodes:
+                        if same_cell and destination_node <= source_node:
+                            continue
+                        horizontal_distance = \
+                            source_coordinates[0] \
+                            - coordinates[destination_node][0]
+                        vertical_distance = \
+                            source_coordinates[1] \
+                            - coordinates[destination_node][1]
+                        if sqrt(horizontal_distance * horizontal_distance
+                                + vertical_distance * vertical_distance) \
+                           <= transmission_range:
+                            neighbors[source_node].append(destination_node)
+                            neighbors[destination_node].append(source_node)
+        for node_neighbors in neighbors:
+            node_neighbors.sort()
+        self.logger.debug('Neighboring nodes has been computed for %d nodes',
+                          len(coordinates))
         return neighbors
@@ -99,7 +99,8 @@ class Sim2Net(object):
         environment['application'] = \
             self.__get_application_class(application_file)
         self.__total_simulation_steps = environment['total_simulation_steps']
-        self.__network = Network(environment)
+        self.__network = \
+            Network(environment, configuration.get('message_clone'))
 
     def __report_error(self, element, name):
         """
@@ -166,7 +167,7 @@ class Sim2Net(object):
             if len(nested_members) > 1:
                 if nested_members[1].__name__ == Application.__name__:
                     self.__logger.debug('Application class "%s" has been'
-                                        ' loaded' % nested_members[0].__name__)
+                                        ' loaded', nested_members[0].__name__)
                     return nested_members[0]
         message = 'Cannot find any appropriate application class in file' \
                   ' "%s"!' % application_file
@@ -34,6 +34,10 @@ __MAIN_LOGGING_CHANNEL = 'sim2net'
 #: :func:`create_logger` function).
 __CREATED = False
 
+#: Loggers of the logging channels returned by the :func:`get_logger` function
+#: (by channel strings).
+__CHANNEL_LOGGERS = dict()
+
 
 class Sim2NetFormatter(logging.Formatter):
     """
@@ -74,6 +78,36 @@ class Sim2NetFormatter(logging.Formatter):
             return msg[:24] + '%s ' % self.__time + msg[24:]
 
 
+class LazyString(object):
+    """
+    Defers building a log message argument until the message is actually
+    formatted, that is, until it is known that the message will be emitted.
+
+    *Example*:
+
+    .. doctest::
+        :options: +SKIP
+
+        >>> logger.debug('Nodes: %s',
+        ...              LazyString(lambda: ', '.join(str(n) for n in nodes)))
+    """
+
+    def __init__(self, function, *arguments):
+        """
+        *Parameters*:
+            - **function**: a function that returns the argument's string;
+            - **arguments**: positional arguments to call the function with.
+        """
+        self.__function = function
+        self.__arguments = arguments
+
+    def __str__(self):
+        """
+        Returns the result of calling the given function.
+        """
+        return self.__function(*self.__arguments)
+
+
 def __channel_string(channel):
     """
     Returns a logging channel string for a given string.
@@ -148,6 +182,10 @@ def get_logger(channel=None):
         return create_logger()
     if channel is None:
         return logging.getLogger(__MAIN_LOGGING_CHANNEL)
-    if not __CREATED:
-        create_logger()
-    return logging.getLogger(__channel_string(channel))
+    channel_logger = __CHANNEL_LOGGERS.get(channel)
+    if channel_logger is None:
+        if not __CREATED:
+            create_logger()
+        channel_logger = logging.getLogger(__channel_string(channel))
+        __CHANNEL_LOGGERS[channel] = channel_logger
+    return channel_logger
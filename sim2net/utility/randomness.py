@@ -37,6 +37,7 @@ class _Randomness(object):
 
     def __init__(self):
         self.__random = random.Random()
+        self.__random_float = self.__random.random
 
     def set_state(self, generator_state):
         """
@@ -66,13 +67,22 @@ class _Randomness(object):
         """
         return self.__random.getstate()
 
+    def random(self):
+        """
+        Returns a random floating point number :math:`N` such that
+        :math:`0\\leqslant N < 1`.
+        """
+        return self.__random.random()
+
     def uniform(self, begin, end):
         """
         Returns a random floating point number :math:`N` such that
         :math:`begin\\leqslant N\\leqslant end` for :math:`begin\\leqslant end`
         and :math:`end\\leqslant N\\leqslant begin` for :math:`end < begin`.
         """
-        return self.__random.uniform(begin, end)
+        # the same formula as in the random.Random.uniform() method, without
+        # the overhead of another Python-level call
+        return begin + (end - begin) * self.__random_float()
 
     def normal(self, mikro, sigma):
         """
@@ -87,6 +97,13 @@ class _Randomness(object):
         """
         return self.__random.gauss(mikro, sigma)
 
+    def sample(self, population, sample_size):
+        """
+        Returns a list of *sample_size* unique elements chosen from the given
+        **population** sequence.
+        """
+        return self.__random.sample(population, sample_size)
+
     def random_order(self, sequence):
         """
         Shuffles the given **sequence** *in place*.